@@ -1,16 +1,25 @@
+import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import PySide6.QtAsyncio as QtAsyncio
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
-from finch.config import CONFIG_PATH, app_settings
-from finch.utils.ui import apply_theme, resource_path
+from finch.config import CONFIG_PATH, THREAD_POOL_SIZE, app_settings
+from finch.utils.ui import apply_theme, load_icon
 from finch.browser.window import MainWindow
 
 
+async def _install_executor():
+    # asyncio.to_thread() runs every S3 call on the loop's default executor;
+    # share one pool sized for network-bound work instead of the CPU-based default.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="finch-s3")
+    )
+
+
 def main():
     os.makedirs(CONFIG_PATH, exist_ok=True)
     Path(os.path.join(CONFIG_PATH, 'credentials.json')).touch()
@@ -18,12 +27,12 @@ def main():
     app_settings.apply_logging()
     app = QApplication(sys.argv)
     app.setApplicationName('Finch S3 Client')
-    app.setWindowIcon(QIcon(resource_path("img/icon.png")))
+    app.setWindowIcon(load_icon("img/icon.png"))
     apply_theme(app)
 
     window = MainWindow()
     window.show()
-    QtAsyncio.run(handle_sigint=True)
+    QtAsyncio.run(_install_executor(), handle_sigint=True)
 
 
 if __name__ == '__main__':
@@ -1,8 +1,7 @@
-from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QDialogButtonBox
 
-from finch.utils.ui import center_window, resource_path
+from finch.utils.ui import center_window, load_font, load_pixmap
 
 
 class AboutDialog(QDialog):
@@ -17,15 +16,14 @@ class AboutDialog(QDialog):
         layout.setSpacing(6)
 
         icon_label = QLabel()
-        icon_label.setPixmap(QIcon(resource_path("img/icon.png")).pixmap(QSize(80, 80)))
+        icon_label.setPixmap(load_pixmap("img/icon.png", 80))
         icon_label.setAlignment(Qt.AlignCenter)
 
         title_label = QLabel("Finch S3 Client")
-        title_label.setFont(QFont("sans", 24))
+        title_label.setFont(load_font("sans", 24))
         title_label.setAlignment(Qt.AlignCenter)
 
-        italic = QFont("sans", 11)
-        italic.setItalic(True)
+        italic = load_font("sans", 11, italic=True)
 
         subtitle_label = QLabel(
             'In memoriam of '
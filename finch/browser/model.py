@@ -1,44 +1,164 @@
 import asyncio
 import os
 import tempfile
+import time
+from contextlib import aclosing, contextmanager
 from dataclasses import dataclass, field
-from typing import List, Optional
+from itertools import chain
+from operator import attrgetter
+from typing import AsyncIterator, Coroutine, Dict, Iterator, List, Optional, Set, Tuple
 
 from PySide6.QtCore import Signal, Qt, QModelIndex, QAbstractItemModel, QFileInfo
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QFileIconProvider
 
 from finch.s3 import s3_service, S3Object
-from finch.config import ObjectType, app_settings
+from finch.config import ObjectType, THREAD_POOL_SIZE, app_settings
 from finch.utils.text import format_size, format_datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class S3Node:
     s3_object: Optional[S3Object]
     parent: Optional['S3Node'] = field(default=None, repr=False)
     children: List['S3Node'] = field(default_factory=list)
+    # (key, type) -> child, kept in step with children for O(1) lookups.
+    child_index: Dict[Tuple[str, ObjectType], 'S3Node'] = field(
+        default_factory=dict, repr=False, compare=False)
     is_loaded: bool = False
     is_loading: bool = False
+    # Lowercased name, computed once for the name sort key.
+    sort_name: str = field(init=False, repr=False, default='')
+    # Formatted Size/Date cells, filled on first paint. Saving settings (which
+    # may change the date format) rebuilds the tree, so they never go stale.
+    display_size: Optional[str] = field(init=False, repr=False, default=None)
+    display_date: Optional[str] = field(init=False, repr=False, default=None)
+    # Last known position among the parent's children; verified on every use.
+    _row: int = field(init=False, repr=False, compare=False, default=0)
+    # Background listing of this folder's first page, started before it is expanded.
+    lookahead: Optional[asyncio.Task] = field(init=False, repr=False, compare=False, default=None)
+    # Key of the outermost folder merged into this one by compaction.
+    collapsed_key: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self):
+        if self.s3_object is not None:
+            self.sort_name = self.s3_object.name.lower()
+
+    @classmethod
+    def for_object(cls, s3_object: S3Object, parent: 'S3Node') -> 'S3Node':
+        """Build a listing node without the generated __init__.
+
+        Listings create thousands of nodes at once; assigning the slots
+        directly skips keyword parsing and the default factories, about
+        twice as fast. Keep in step with the fields above.
+        """
+        node = cls.__new__(cls)
+        node.s3_object = s3_object
+        node.parent = parent
+        node.children = []
+        node.child_index = {}
+        node.is_loaded = False
+        node.is_loading = False
+        node.sort_name = s3_object.name.lower()
+        node.display_size = None
+        node.display_date = None
+        node._row = 0
+        node.lookahead = None
+        node.collapsed_key = None
+        return node
+
+    @property
+    def folder_prefix(self) -> str:
+        """Prefix covering everything this row shows, including compacted parents."""
+        return self.collapsed_key or self.s3_object.key
 
     @property
     def row(self) -> int:
-        if self.parent:
-            return self.parent.children.index(self)
-        return 0
+        """Position in parent.children; O(1) unless siblings moved since last asked."""
+        if self.parent is None:
+            return 0
+        siblings = self.parent.children
+        hint = self._row
+        if hint < len(siblings) and siblings[hint] is self:
+            return hint
+        # Stale after a sort/removal: renumber every sibling in one pass.
+        for i, sibling in enumerate(siblings):
+            sibling._row = i
+        if self._row < len(siblings) and siblings[self._row] is self:
+            return self._row
+        raise ValueError("node is not among its parent's children")
+
+
+# Unexpanded folders listed ahead after their parent loads, and for how many
+# seconds that listing is trusted when the folder is then expanded.
+LOOKAHEAD_FOLDERS = 8
+LOOKAHEAD_TTL = 10
+
+# Background requests (emptiness checks, look-ahead) allowed on the shared
+# executor at once, so they can't queue ahead of a listing the user asked for.
+BACKGROUND_REQUESTS = THREAD_POOL_SIZE // 2
+
+# Roles named in dataChanged, so listeners can skip the roles that did not
+# change: a folder found empty only loses its expand indicator next to the
+# icon; a compacted folder is only renamed.
+_INDICATOR_ROLES = [Qt.DecorationRole]
+_NAME_ROLES = [Qt.DisplayRole]
+
+# Sort key per column; folders and buckets always stay above files.
+_SORT_KEYS = {
+    0: attrgetter('sort_name'),
+    1: attrgetter('s3_object.type'),
+    2: attrgetter('s3_object.size'),
+    3: lambda n: n.s3_object.last_modified.timestamp() if n.s3_object.last_modified else 0.0,
+}
+
+
+async def _prefetch_pages(pages: Iterator[list]) -> AsyncIterator[list]:
+    """Yield pages from a blocking page iterator without blocking the event loop.
+
+    The next page is requested on a worker thread before the current one is
+    handed out, so the network round-trip overlaps with inserting rows. A
+    listing error ends the stream.
+    """
+    pending = asyncio.ensure_future(asyncio.to_thread(next, pages, None))
+    try:
+        while True:
+            try:
+                batch = await pending
+            except Exception:
+                return
+            if batch is None:
+                return
+            pending = asyncio.ensure_future(asyncio.to_thread(next, pages, None))
+            yield batch
+    finally:
+        # Abandoned early: let the in-flight page finish unobserved.
+        pending.add_done_callback(lambda f: f.cancelled() or f.exception())
 
 
 class S3FileTreeModel(QAbstractItemModel):
     loading_started = Signal()
     loading_finished = Signal()
 
+    # Icons are shared by every model instance (one per credential switch);
+    # built on first use because QIcon needs a running QApplication.
+    _icon_provider: Optional[QFileIconProvider] = None
+    _type_icons: Dict[ObjectType, QIcon] = {}
+    _ext_icons: Dict[str, QIcon] = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._root = S3Node(s3_object=None)
         self._active_loads: int = 0
-        self._icon_provider = QFileIconProvider()
-        self._icon_cache: dict = {}
-        self._folder_icon = self._icon_provider.icon(QFileIconProvider.IconType.Folder)
-        self._bucket_icon = self._icon_provider.icon(QFileIconProvider.IconType.Drive)
+        self._cancelled: bool = False
+        # Listings and probes in flight; the loop itself only holds weak references.
+        self._tasks: Set[asyncio.Task] = set()
+        # Caps look-ahead and emptiness probes only. User listings never acquire
+        # it, nor wait on a task that does (see _take_lookahead).
+        self._background = asyncio.Semaphore(BACKGROUND_REQUESTS)
+        self._sort_column: int = 0
+        self._sort_order = Qt.AscendingOrder
+        self._init_icons()
 
     # ── Core QAbstractItemModel interface ──────────────────────────────────
 
@@ -79,11 +199,15 @@ class S3FileTreeModel(QAbstractItemModel):
             if col == 0:
                 return obj.name
             if col == 1:
-                return obj.type
+                return obj.type.value  # plain str; the enum member converts slower
             if col == 2:
-                return format_size(obj.size)
+                if node.display_size is None:
+                    node.display_size = format_size(obj.size)
+                return node.display_size
             if col == 3:
-                return format_datetime(obj.last_modified)
+                if node.display_date is None:
+                    node.display_date = format_datetime(obj.last_modified)
+                return node.display_date
         elif role == Qt.DecorationRole and col == 0:
             return self._get_icon(obj)
         elif role == Qt.UserRole:
@@ -95,27 +219,90 @@ class S3FileTreeModel(QAbstractItemModel):
             return ["Name", "Type", "Size", "Date"][section]
         return None
 
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        """Sort every loaded level in place; later loads follow the same order."""
+        if column not in _SORT_KEYS:
+            return
+        self._sort_column, self._sort_order = column, order
+        self._relayout(self._root, recursive=True)
+
+    def _resort_children(self, node: S3Node) -> None:
+        """Restore sort order for one node whose children arrived in several batches."""
+        self._relayout(node, recursive=False)
+
+    def _relayout(self, top: S3Node, recursive: bool) -> None:
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        nodes = [(idx.internalPointer(), idx.column()) for idx in old]
+        stack = [top]
+        while stack:
+            node = stack.pop()
+            self._sort_children(node.children)
+            if recursive:
+                # Unloaded folders have no children, so only the loaded part is walked.
+                stack.extend(c for c in node.children if c.children)
+        self.changePersistentIndexList(
+            old, [self.createIndex(n.row, col, n) for n, col in nodes]
+        )
+        self.layoutChanged.emit()
+
+    def _sort_children(self, children: List[S3Node]) -> None:
+        if len(children) < 2:
+            return
+        children.sort(key=_SORT_KEYS[self._sort_column],
+                      reverse=self._sort_order == Qt.DescendingOrder)
+        # Stable partition: containers first in either direction.
+        file = ObjectType.FILE
+        children[:] = ([n for n in children if n.s3_object.type is not file]
+                       + [n for n in children if n.s3_object.type is file])
+
+    def _insertion_row(self, children: List[S3Node], node: S3Node) -> int:
+        """Binary-search the row _sort_children would give node among sorted children.
+
+        Equal keys go after existing siblings, as the stable sort would leave them.
+        """
+        key = _SORT_KEYS[self._sort_column]
+        descending = self._sort_order == Qt.DescendingOrder
+        is_file = node.s3_object.type is ObjectType.FILE
+        node_key = key(node)
+        lo, hi = 0, len(children)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = children[mid]
+            other_is_file = other.s3_object.type is ObjectType.FILE
+            if other_is_file != is_file:
+                before = not other_is_file
+            else:
+                other_key = key(other)
+                before = other_key >= node_key if descending else other_key <= node_key
+            if before:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
     # ── Lazy loading ───────────────────────────────────────────────────────
 
     def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
         if not parent.isValid():
             return bool(self._root.children)
         node: S3Node = parent.internalPointer()
-        obj = node.s3_object
-        if obj.type not in (ObjectType.BUCKET, ObjectType.FOLDER):
-            return False
+        # Cheapest and most common answers first: a loaded folder with rows.
+        if node.children:
+            return True
         if node.is_loaded:
-            return bool(node.children)
-        return True
+            return False
+        # Identity test: a miss in (BUCKET, FOLDER) would fall back to str comparisons.
+        return node.s3_object.type is not ObjectType.FILE
 
     def canFetchMore(self, parent: QModelIndex) -> bool:
         if not parent.isValid():
             return False
         node: S3Node = parent.internalPointer()
         return (
-            node.s3_object.type in (ObjectType.BUCKET, ObjectType.FOLDER)
-            and not node.is_loaded
+            not node.is_loaded
             and not node.is_loading
+            and node.s3_object.type is not ObjectType.FILE
         )
 
     def fetchMore(self, parent: QModelIndex):
@@ -126,62 +313,250 @@ class S3FileTreeModel(QAbstractItemModel):
             return
         node.is_loading = True
         self._inc_load()
-        asyncio.ensure_future(self._fetch_async(node))
+        self._spawn(self._fetch_async(node))
 
     async def _fetch_async(self, node: S3Node):
+        pages = self._take_lookahead(node)
+        while True:
+            if pages is None:
+                obj = node.s3_object
+                if obj.type is ObjectType.BUCKET:
+                    pages = s3_service.iter_objects(obj.name, '')
+                else:
+                    pages = s3_service.iter_objects(obj.bucket_name, obj.key)
+            # Insert page by page so large folders paint while they are still listing.
+            inserted_pages = 0
+            async with aclosing(_prefetch_pages(pages)) as batches:
+                async for batch in batches:
+                    if node.parent is None:
+                        break
+                    self._insert_children(node, batch)
+                    inserted_pages += 1
+            if inserted_pages > 1 and node.parent is not None:
+                self._resort_children(node)
+            if not self._compact(node):
+                break
+            pages = None
+        self._finish_load(node)
+        self._start_lookahead(node)
+
+    # ── Look-ahead ─────────────────────────────────────────────────────────
+
+    def _start_lookahead(self, node: S3Node) -> None:
+        """List the first few unexpanded sub-folders so drilling down is instant."""
+        if node.parent is None:
+            return
+        for child in node.children[:LOOKAHEAD_FOLDERS]:
+            if (child.s3_object.type is ObjectType.FOLDER and child.lookahead is None
+                    and not (child.is_loaded or child.is_loading)):
+                child.lookahead = self._spawn(self._lookahead_async(child))
+
+    async def _lookahead_async(self, node: S3Node) -> Optional[Tuple[float, Optional[list], Iterator[list]]]:
+        obj = node.s3_object
+        pages = s3_service.iter_objects(obj.bucket_name, obj.key)
         try:
-            obj = node.s3_object
-            if obj.type == ObjectType.BUCKET:
-                objects = await asyncio.to_thread(s3_service.list_objects, obj.name, '')
-            else:
-                objects = await asyncio.to_thread(s3_service.list_objects, obj.bucket_name, obj.key)
+            async with self._background:
+                first = await asyncio.to_thread(next, pages, None)
         except Exception:
-            objects = []
-        self._on_objects_loaded(node, objects)
+            return None
+        return time.monotonic(), first, pages
+
+    @staticmethod
+    def _take_lookahead(node: S3Node) -> Optional[Iterator[list]]:
+        """Adopt node's look-ahead listing if it is done and fresh; the rest of its pages follow.
+
+        A look-ahead still queued behind background probes is dropped rather
+        than awaited: the user's listing must never wait on background work.
+        """
+        task, node.lookahead = node.lookahead, None
+        if task is None:
+            return None
+        if not task.done():
+            task.cancel()
+            return None
+        result = None if task.cancelled() else task.result()
+        if result is None:
+            return None
+        fetched, first, pages = result
+        if time.monotonic() - fetched > LOOKAHEAD_TTL:
+            return None
+        return chain([first] if first is not None else [], pages)
+
+    def _compact(self, node: S3Node) -> bool:
+        """Merge a folder whose only child is a folder into that child.
+
+        The node takes over the child's key and shows the joined name
+        ("a/b"), so a deep prefix chain costs one row instead of one per
+        level. Returns True if the caller should list the node again.
+        """
+        if not (app_settings.compact_single_child_chains and node.parent is not None
+                and node.s3_object.type is ObjectType.FOLDER and len(node.children) == 1
+                and node.children[0].s3_object.type is ObjectType.FOLDER):
+            return False
+        old, child = node.s3_object, node.children[0].s3_object
+        parent_index = node.parent.child_index
+        self.beginRemoveRows(self._node_to_index(node), 0, 0)
+        removed, node.children = node.children, []
+        node.child_index.clear()
+        self.endRemoveRows()
+        self._detach(removed)
+
+        node.s3_object = S3Object(
+            key=child.key,
+            name=f"{old.name}/{child.name}",
+            type=ObjectType.FOLDER,
+            bucket_name=old.bucket_name,
+        )
+        node.sort_name = node.s3_object.name.lower()
+        if node.collapsed_key is None:
+            node.collapsed_key = old.key
+        del parent_index[(old.key, old.type)]
+        parent_index[(child.key, ObjectType.FOLDER)] = node
+        idx = self._node_to_index(node)
+        self.dataChanged.emit(idx, idx, _NAME_ROLES)
+        self._move_to_sorted_row(node)
+        return True
+
+    def _move_to_sorted_row(self, node: S3Node) -> None:
+        """Move node to the row its (changed) sort key belongs at among its siblings."""
+        siblings = node.parent.children
+        row = node.row
+        target = self._insertion_row(siblings[:row] + siblings[row + 1:], node)
+        if target == row:
+            return
+        parent_index = self._node_to_index(node.parent)
+        # Qt wants the destination as a row in the list before the move.
+        self.beginMoveRows(parent_index, row, row, parent_index,
+                           target + 1 if target > row else target)
+        del siblings[row]
+        siblings.insert(target, node)
+        self.endMoveRows()
 
     def _on_objects_loaded(self, node: S3Node, objects: list):
-        parent_index = self._node_to_index(node)
-        if objects:
-            self.beginInsertRows(parent_index, 0, len(objects) - 1)
-            for obj in objects:
-                node.children.append(S3Node(s3_object=obj, parent=node))
+        if node.parent is not None:
+            self._insert_children(node, objects)
+        self._finish_load(node)
+
+    def _insert_children(self, node: S3Node, objects: list) -> None:
+        """Append a listing page and check its new folders for emptiness."""
+        new_nodes = self._append_children(node, objects)
+        if new_nodes and app_settings.check_folder_contents:
+            folders = [c for c in new_nodes if c.s3_object.type is ObjectType.FOLDER]
+            if folders:
+                self._spawn(self._empty_check_batch_async(node, folders))
+
+    def _append_children(self, node: S3Node, objects: list) -> List[S3Node]:
+        """Append objects not already under node (e.g. added by insert_child mid-load)."""
+        index = node.child_index
+        new_nodes = []
+        for obj in objects:
+            ident = (obj.key, obj.type)
+            if ident not in index:
+                child = S3Node.for_object(obj, node)
+                index[ident] = child
+                new_nodes.append(child)
+        if new_nodes:
+            self._sort_children(new_nodes)
+            first = len(node.children)
+            self.beginInsertRows(self._node_to_index(node), first, first + len(new_nodes) - 1)
+            node.children.extend(new_nodes)
             self.endInsertRows()
-            if app_settings.check_folder_contents:
-                for child in node.children:
-                    if child.s3_object.type == ObjectType.FOLDER:
-                        asyncio.ensure_future(self._empty_check_async(child))
-        node.is_loaded = True
+        return new_nodes
+
+    def _finish_load(self, node: S3Node) -> None:
+        # A node removed or refreshed away mid-listing stays unloaded and detached.
+        if node.parent is not None:
+            node.is_loaded = True
         node.is_loading = False
         self._dec_load()
 
     # ── Empty-folder check ─────────────────────────────────────────────────
 
+    async def _empty_check_batch_async(self, parent: S3Node, folders: List[S3Node]):
+        """Settle a page of new folders with one listing of their parent.
+
+        Folders the bulk listing couldn't reach get an individual probe.
+        """
+        self._inc_load()
+        obj = parent.s3_object
+        if obj.type is ObjectType.BUCKET:
+            bucket, prefix = obj.name, ''
+        else:
+            bucket, prefix = obj.bucket_name, obj.key
+        keys = [f.s3_object.key for f in folders]
+        try:
+            async with self._background:
+                settled = await asyncio.to_thread(s3_service.probe_folders, bucket, prefix, keys)
+        except Exception:
+            settled = {}
+        emptied = []
+        for folder, key in zip(folders, keys):
+            is_empty = settled.get(key)
+            if is_empty is None:
+                self._spawn(self._empty_check_async(folder))
+            elif is_empty and self._mark_empty(folder):
+                emptied.append(folder)
+        self._emit_rows_changed(emptied)
+        self._dec_load()
+
     async def _empty_check_async(self, node: S3Node):
         self._inc_load()
         try:
-            obj = node.s3_object
-            objects = await asyncio.to_thread(s3_service.list_objects, obj.bucket_name, obj.key)
-            is_empty = len(objects) == 0
+            async with self._background:
+                is_empty = await asyncio.to_thread(self._probe_empty, node)
         except Exception:
             is_empty = False
         self._on_empty_check_done(node, is_empty)
 
+    @staticmethod
+    def _probe_empty(node: S3Node) -> bool:
+        # Checks run queued behind each other; by the time this one gets a
+        # worker the folder may have been expanded or removed, making it moot.
+        if node.is_loading or node.is_loaded or node.parent is None:
+            return False
+        obj = node.s3_object
+        return s3_service.is_folder_empty(obj.bucket_name, obj.key)
+
     def _on_empty_check_done(self, node: S3Node, is_empty: bool):
-        if is_empty:
-            node.is_loaded = True
-            idx = self._node_to_index(node)
-            self.dataChanged.emit(idx, idx)
+        if is_empty and self._mark_empty(node):
+            self._emit_rows_changed([node])
         self._dec_load()
 
+    @staticmethod
+    def _mark_empty(node: S3Node) -> bool:
+        # Results arrive late; an expanded, expanding or removed folder knows better.
+        if node.parent is not None and not (node.is_loading or node.is_loaded):
+            node.is_loaded = True
+            return True
+        return False
+
+    def _emit_rows_changed(self, nodes: List[S3Node]) -> None:
+        """Emit one dataChanged per parent, spanning the rows of nodes under it.
+
+        The span must start at column 0: that is where QTreeView re-reads its
+        cached hasChildren, which is all that changes for an emptied folder.
+        """
+        spans: Dict[int, Tuple[S3Node, int, int]] = {}
+        for node in nodes:
+            row = node.row
+            parent, first, last = spans.get(id(node.parent), (node.parent, row, row))
+            spans[id(parent)] = (parent, min(first, row), max(last, row))
+        for parent, first, last in spans.values():
+            parent_index = self._node_to_index(parent)
+            self.dataChanged.emit(self.index(first, 0, parent_index),
+                                  self.index(last, 0, parent_index), _INDICATOR_ROLES)
+
     # ── Bucket loading ─────────────────────────────────────────────────────
 
     def load_buckets(self):
         """Clear tree and reload all buckets from S3."""
         self.beginResetModel()
-        self._root.children.clear()
+        old, self._root.children = self._root.children, []
+        self._root.child_index.clear()
         self.endResetModel()
+        self._detach(old)
         self._inc_load()
-        asyncio.ensure_future(self._load_buckets_async())
+        self._spawn(self._load_buckets_async())
 
     async def _load_buckets_async(self):
         try:
@@ -191,15 +566,49 @@ class S3FileTreeModel(QAbstractItemModel):
         self._on_buckets_loaded(buckets)
 
     def _on_buckets_loaded(self, buckets: list):
-        if buckets:
-            self.beginInsertRows(QModelIndex(), 0, len(buckets) - 1)
-            for bucket in buckets:
-                self._root.children.append(S3Node(s3_object=bucket, parent=self._root))
+        if buckets and not self._cancelled:
+            nodes = [S3Node.for_object(bucket, self._root) for bucket in buckets]
+            self._root.child_index.update(((n.s3_object.key, n.s3_object.type), n) for n in nodes)
+            self._sort_children(nodes)
+            self.beginInsertRows(QModelIndex(), 0, len(nodes) - 1)
+            self._root.children.extend(nodes)
             self.endInsertRows()
         self._dec_load()
 
+    def cancel(self) -> None:
+        """Abandon this tree without waiting on in-flight S3 calls.
+
+        Pending listings and probes are cancelled at their next await and
+        every node is detached, so any result that still lands is dropped;
+        signals are blocked so a replaced model can't drive the shared
+        loading indicator any more. A blocking S3 call already on a worker
+        thread runs to completion there, unobserved.
+        """
+        self._cancelled = True
+        self.blockSignals(True)
+        for task in self._tasks:
+            task.cancel()
+        old, self._root.children = self._root.children, []
+        self._root.child_index.clear()
+        self._detach(old)
+
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
     # ── Loading state ──────────────────────────────────────────────────────
 
+    @contextmanager
+    def busy(self):
+        """Keep the loading indicator on while a non-listing S3 call runs."""
+        self._inc_load()
+        try:
+            yield
+        finally:
+            self._dec_load()
+
     def _inc_load(self):
         if self._active_loads == 0:
             self.loading_started.emit()
@@ -213,15 +622,57 @@ class S3FileTreeModel(QAbstractItemModel):
     # ── Direct tree mutations ──────────────────────────────────────────────
 
     def insert_child(self, parent_node: S3Node, s3_object: S3Object) -> S3Node:
-        """Append a new child to parent_node without reloading the whole tree."""
+        """Insert a new child at its sorted row without reloading the whole tree.
+
+        If a child with the same key and type is already there (e.g. a file
+        uploaded again), it takes the new object and is returned instead.
+        """
+        ident = (s3_object.key, s3_object.type)
+        existing = parent_node.child_index.get(ident)
+        if existing is not None:
+            self._refresh_node(existing, s3_object)
+            if self._sort_column >= 2:
+                self._move_to_sorted_row(existing)
+            return existing
         parent_index = self._node_to_index(parent_node)
-        row = len(parent_node.children)
-        self.beginInsertRows(parent_index, row, row)
         new_node = S3Node(s3_object=s3_object, parent=parent_node)
-        parent_node.children.append(new_node)
+        row = self._insertion_row(parent_node.children, new_node)
+        self.beginInsertRows(parent_index, row, row)
+        parent_node.children.insert(row, new_node)
+        parent_node.child_index[ident] = new_node
         self.endInsertRows()
         return new_node
 
+    def insert_children(self, parent_node: S3Node, objects: List[S3Object]) -> None:
+        """Add many children with one row insertion and at most one re-sort.
+
+        Objects already under parent_node refresh their row, as with insert_child.
+        """
+        index = parent_node.child_index
+        fresh = []
+        refreshed = False
+        for obj in objects:
+            existing = index.get((obj.key, obj.type))
+            if existing is None:
+                fresh.append(obj)
+            else:
+                self._refresh_node(existing, obj)
+                refreshed = True
+        had_children = bool(parent_node.children)
+        # Name and type never change on a refresh; size and date may.
+        if ((self._append_children(parent_node, fresh) and had_children)
+                or (refreshed and self._sort_column >= 2)):
+            self._resort_children(parent_node)
+
+    def _refresh_node(self, node: S3Node, s3_object: S3Object) -> None:
+        """Show s3_object in node's row, dropping the cells formatted for the old one."""
+        node.s3_object = s3_object
+        node.display_size = None
+        node.display_date = None
+        row = node.row
+        parent_index = self._node_to_index(node.parent)
+        self.dataChanged.emit(self.index(row, 0, parent_index), self.index(row, 3, parent_index))
+
     def remove_node(self, node: S3Node) -> None:
         """Remove node from its parent without reloading the whole tree."""
         parent_node = node.parent
@@ -230,48 +681,102 @@ class S3FileTreeModel(QAbstractItemModel):
         row = node.row
         parent_index = self._node_to_index(parent_node)
         self.beginRemoveRows(parent_index, row, row)
-        parent_node.children.remove(node)
+        del parent_node.children[row]
+        self._unindex(parent_node, [node])
         self.endRemoveRows()
+        self._detach([node])
+
+    def remove_nodes(self, nodes: List[S3Node]) -> None:
+        """Remove many nodes, one beginRemoveRows per contiguous run of siblings."""
+        by_parent: dict = {}
+        for node in nodes:
+            if node.parent is not None:
+                by_parent.setdefault(id(node.parent), (node.parent, []))[1].append(node)
+
+        for parent_node, doomed in by_parent.values():
+            doomed_ids = {id(n) for n in doomed}
+            rows = [i for i, c in enumerate(parent_node.children) if id(c) in doomed_ids]
+            parent_index = self._node_to_index(parent_node)
+            # Remove from the bottom up so earlier rows keep their positions.
+            end = len(rows) - 1
+            while end >= 0:
+                start = end
+                while start > 0 and rows[start - 1] == rows[start] - 1:
+                    start -= 1
+                first, last = rows[start], rows[end]
+                self.beginRemoveRows(parent_index, first, last)
+                removed = parent_node.children[first:last + 1]
+                del parent_node.children[first:last + 1]
+                self._unindex(parent_node, removed)
+                self.endRemoveRows()
+                self._detach(removed)
+                end = start - 1
+
+    @staticmethod
+    def _unindex(parent_node: S3Node, nodes: List[S3Node]) -> None:
+        for node in nodes:
+            parent_node.child_index.pop((node.s3_object.key, node.s3_object.type), None)
+
+    @staticmethod
+    def _detach(nodes: List[S3Node]) -> None:
+        """Unlink removed subtrees.
+
+        Breaking the parent/children cycles lets refcounting free them right
+        away instead of leaving thousands of nodes to the cyclic GC, and marks
+        them (parent is None) so late listings for them are ignored.
+        """
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children)
+            node.children = []
+            node.child_index = {}
+            node.parent = None
 
     def find_node(self, bucket_name: str, prefix: str = '') -> Optional['S3Node']:
         """Return the loaded node at bucket/prefix, or None if not in the tree."""
-        bucket_node = next(
-            (c for c in self._root.children if c.s3_object.name == bucket_name), None
-        )
-        if bucket_node is None:
-            return None
-        if not prefix:
-            return bucket_node
-        return self._find_in_node(bucket_node, prefix)
-
-    def _find_in_node(self, node: S3Node, key: str) -> Optional['S3Node']:
-        for child in node.children:
-            if child.s3_object.key == key:
-                return child
-            if key.startswith(child.s3_object.key) and child.is_loaded:
-                result = self._find_in_node(child, key)
-                if result:
-                    return result
-        return None
+        node = self._root.child_index.get((bucket_name, ObjectType.BUCKET))
+        if node is None or not prefix:
+            return node
+        # Descend one folder per '/' using each level's child index. A miss
+        # keeps extending the prefix: a compacted chain is indexed by its
+        # deepest key, and otherwise the final lookup simply misses too.
+        start = 0
+        while True:
+            slash = prefix.find('/', start)
+            if slash == -1 or slash == len(prefix) - 1:
+                obj_type = ObjectType.FOLDER if slash != -1 else ObjectType.FILE
+                return node.child_index.get((prefix, obj_type))
+            node = node.child_index.get((prefix[:slash + 1], ObjectType.FOLDER), node)
+            start = slash + 1
 
     # ── Icon resolution ────────────────────────────────────────────────────
 
+    @classmethod
+    def _init_icons(cls) -> None:
+        if cls._icon_provider is not None:
+            return
+        provider = QFileIconProvider()
+        cls._icon_provider = provider
+        cls._type_icons = {
+            ObjectType.BUCKET: provider.icon(QFileIconProvider.IconType.Drive),
+            ObjectType.FOLDER: provider.icon(QFileIconProvider.IconType.Folder),
+            ObjectType.FILE:   provider.icon(QFileIconProvider.IconType.File),
+        }
+
     def _get_icon(self, obj: S3Object):
-        if obj.type == ObjectType.BUCKET:
-            return self._bucket_icon
-        if obj.type == ObjectType.FOLDER:
-            return self._folder_icon
-        if not app_settings.native_file_icons:
-            return self._icon_provider.icon(QFileIconProvider.IconType.File)
+        if obj.type is not ObjectType.FILE or not app_settings.native_file_icons:
+            return self._type_icons[obj.type]
         ext = os.path.splitext(obj.name)[1].lower() or '.bin'
-        if ext not in self._icon_cache:
+        icon = self._ext_icons.get(ext)
+        if icon is None:
             fd, tmp = tempfile.mkstemp(suffix=ext)
             os.close(fd)
             try:
-                self._icon_cache[ext] = self._icon_provider.icon(QFileInfo(tmp))
+                icon = self._ext_icons[ext] = self._icon_provider.icon(QFileInfo(tmp))
             finally:
                 os.unlink(tmp)
-        return self._icon_cache[ext]
+        return icon
 
     # ── Helpers ────────────────────────────────────────────────────────────
 
@@ -3,7 +3,6 @@ import re
 
 from PySide6 import QtWidgets
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QPushButton,
     QTreeWidget, QTreeWidgetItem, QStyle, QLabel, QFrame,
@@ -12,7 +11,7 @@ from PySide6.QtWidgets import (
 from finch.s3 import s3_service
 from finch.config import ObjectType
 from finch.utils.text import format_datetime, format_size
-from finch.utils.ui import resource_path
+from finch.utils.ui import load_icon
 
 
 class SearchScope:
@@ -143,7 +142,7 @@ class SearchWidget(QWidget):
         row.addWidget(self.search_button)
 
         close_btn = QPushButton()
-        close_btn.setIcon(QIcon(resource_path('img/close.svg')))
+        close_btn.setIcon(load_icon('img/close.svg'))
         close_btn.setFlat(True)
         close_btn.setObjectName("btn-flat")
         close_btn.clicked.connect(self.close)
@@ -202,28 +201,30 @@ class SearchWidget(QWidget):
         finally:
             self.main_widget.spinner.stop()
 
-        for bucket_name, items in bucket_items.items():
-            if not items:
-                continue
-            bucket_item = self._make_item(bucket_name, ObjectType.BUCKET)
-            self._results_tree.addTopLevelItem(bucket_item)
-            self._populate_tree(bucket_item, self._build_tree(items))
-
-        for i in range(self._results_tree.topLevelItemCount()):
-            self._expand_matching(self._results_tree.topLevelItem(i), term)
+        # Build, expand and select with painting suspended, then repaint once.
+        self._results_tree.setUpdatesEnabled(False)
+        try:
+            for bucket_name, items in bucket_items.items():
+                if not items:
+                    continue
+                bucket_item = self._make_item(bucket_name, ObjectType.BUCKET)
+                self._results_tree.addTopLevelItem(bucket_item)
+                self._populate_tree(bucket_item, self._build_tree(items))
+
+            self._results_tree.expandAll()
+            lowered = term.lower()
+            for i in range(self._results_tree.topLevelItemCount()):
+                self._select_matching(self._results_tree.topLevelItem(i), lowered)
+        finally:
+            self._results_tree.setUpdatesEnabled(True)
 
     def _search_scope(self, scope: SearchScope, term: str,
                       case_sensitive: bool, use_regex: bool) -> list:
         items = []
-        paginator = s3_service.client.get_paginator('list_objects_v2')
-        kwargs = {'Bucket': scope.bucket_name}
-        if scope.prefix:
-            kwargs['Prefix'] = scope.prefix
-        for page in paginator.paginate(**kwargs):
-            for obj in page.get('Contents', []):
-                key = obj['Key']
-                if self._matches(key, term, case_sensitive, use_regex):
-                    items.append((key, obj['Size'], obj['LastModified']))
+        for obj in s3_service.list_inventory(scope.bucket_name, scope.prefix):
+            key = obj['Key']
+            if self._matches(key, term, case_sensitive, use_regex):
+                items.append((key, obj['Size'], obj['LastModified']))
         return items
 
     def _matches(self, key: str, term: str, case_sensitive: bool, use_regex: bool) -> bool:
@@ -266,13 +267,11 @@ class SearchWidget(QWidget):
                 item = self._make_item(key, ObjectType.FILE, size, date)
                 parent.addChild(item)
 
-    def _expand_matching(self, item: QTreeWidgetItem, term: str):
-        if item.childCount():
-            item.setExpanded(True)
-        if term.lower() in item.text(0).lower():
+    def _select_matching(self, item: QTreeWidgetItem, lowered_term: str):
+        if lowered_term in item.text(0).lower():
             item.setSelected(True)
         for i in range(item.childCount()):
-            self._expand_matching(item.child(i), term)
+            self._select_matching(item.child(i), lowered_term)
 
     def _make_item(self, name: str, obj_type: ObjectType,
                    size: int = 0, date=None) -> QTreeWidgetItem:
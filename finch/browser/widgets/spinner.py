@@ -1,7 +1,14 @@
-from PySide6.QtCore import Qt, QTimer, QRect
-from PySide6.QtGui import QPainter, QColor
+from typing import List, Optional
+
+from PySide6.QtCore import Qt, QTimer, QRect, Slot
+from PySide6.QtGui import QPainter, QColor, QPixmap
 from PySide6.QtWidgets import QWidget
 
+# Degrees the spinner turns per tick; one segment of twelve.
+_STEP = 30
+# Milliseconds per tick.
+_INTERVAL_MS = 80
+
 
 class QProgressIndicator(QWidget):
     """macOS-style animated spinner (rotating segments)."""
@@ -9,32 +16,63 @@ class QProgressIndicator(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._angle = 0
+        self._running = False
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._rotate)
         self._color = QColor(100, 100, 100)
+        # One pre-rendered pixmap per rotation step, for the current device pixel ratio.
+        self._frames: List[QPixmap] = []
+        self._frames_ratio: Optional[float] = None
         self.setFixedSize(20, 20)
         self.hide()
 
+    @Slot()
     def start(self):
-        self._timer.start(80)
+        self._running = True
         self.show()
+        self._timer.start(_INTERVAL_MS)
 
+    @Slot()
     def stop(self):
+        self._running = False
         self._timer.stop()
         self.hide()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._running:
+            self._timer.start(_INTERVAL_MS)
+
+    def hideEvent(self, event):
+        # Also sent when the window is minimised or a parent is hidden; an
+        # unseen spinner needn't wake the event loop.
+        super().hideEvent(event)
+        self._timer.stop()
+
+    @Slot()
     def _rotate(self):
-        self._angle = (self._angle + 30) % 360
+        self._angle = (self._angle + _STEP) % 360
         self.update()
 
     def paintEvent(self, event):
-        painter = QPainter(self)
+        ratio = self.devicePixelRatioF()
+        if ratio != self._frames_ratio:
+            self._frames = [self._render_frame(angle, ratio) for angle in range(0, 360, _STEP)]
+            self._frames_ratio = ratio
+        QPainter(self).drawPixmap(0, 0, self._frames[self._angle // _STEP])
+
+    def _render_frame(self, start_angle: int, ratio: float) -> QPixmap:
+        """Draw the spinner at one rotation; frames only differ by start_angle."""
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.translate(self.width() / 2, self.height() / 2)
 
         segments = 12
         for i in range(segments):
-            angle = self._angle + i * (360 / segments)
+            angle = start_angle + i * (360 / segments)
             opacity = (i + 1) / segments
             color = QColor(self._color)
             color.setAlphaF(opacity)
@@ -49,3 +87,5 @@ class QProgressIndicator(QWidget):
                 2, 2,
             )
             painter.restore()
+        painter.end()
+        return pixmap
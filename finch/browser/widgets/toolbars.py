@@ -1,10 +1,10 @@
 from PySide6 import QtCore
-from PySide6.QtCore import QSize
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QToolBar, QComboBox, QWidget, QSizePolicy, QLabel
 
 from finch.config import ObjectType
-from finch.utils.ui import resource_path
+from finch.utils.ui import load_icon, load_pixmap
 
 
 class CredentialsToolbar(QToolBar):
@@ -14,7 +14,7 @@ class CredentialsToolbar(QToolBar):
         self.setToolButtonStyle(QtCore.Qt.ToolButtonTextUnderIcon)
 
         icon_label = QLabel()
-        icon_label.setPixmap(QIcon(resource_path("img/icon.png")).pixmap(QSize(36, 36)))
+        icon_label.setPixmap(load_pixmap("img/icon.png", 36))
         icon_label.setContentsMargins(6, 0, 4, 0)
         self.addWidget(icon_label)
 
@@ -30,6 +30,22 @@ class CredentialsToolbar(QToolBar):
         self.credential_selector.blockSignals(False)
 
 
+def _deferred(slot):
+    """Run slot on the next event-loop turn, once the clicked button has repainted."""
+    return lambda *_: QTimer.singleShot(0, slot)
+
+
+# Enabled flags for (upload, create, delete, download, refresh, search).
+_ENABLED_NO_SELECTION = (False, True, False, False, True, True)
+_ENABLED_FILES        = (False, False, True, True, True, True)
+_ENABLED_CONTAINER    = (True, True, True, False, True, True)
+_ENABLED_BY_TYPE = {
+    ObjectType.BUCKET: _ENABLED_CONTAINER,
+    ObjectType.FOLDER: _ENABLED_CONTAINER,
+    ObjectType.FILE:   _ENABLED_FILES,
+}
+
+
 class FileToolbar(QToolBar):
     def __init__(self, window):
         super().__init__("File", window)
@@ -38,87 +54,74 @@ class FileToolbar(QToolBar):
 
         self.upload_action = QAction(self)
         self.upload_action.setText("&Upload")
-        self.upload_action.setIcon(QIcon(resource_path('img/upload.svg')))
+        self.upload_action.setIcon(load_icon('img/upload.svg'))
         self.upload_action.triggered.connect(window.upload_file)
         self.upload_action.setDisabled(True)
 
         self.create_action = QAction(self)
         self.create_action.setText("&Create")
-        self.create_action.setIcon(QIcon(resource_path('img/new-folder.svg')))
+        self.create_action.setIcon(load_icon('img/new-folder.svg'))
         self.create_action.triggered.connect(window.create)
 
         self.delete_action = QAction(self)
         self.delete_action.setText("&Delete")
-        self.delete_action.setIcon(QIcon(resource_path('img/trash.svg')))
+        self.delete_action.setIcon(load_icon('img/trash.svg'))
         self.delete_action.triggered.connect(window.delete)
         self.delete_action.setDisabled(True)
 
         self.download_action = QAction(self)
         self.download_action.setText("&Download")
-        self.download_action.setIcon(QIcon(resource_path('img/download.svg')))
+        self.download_action.setIcon(load_icon('img/download.svg'))
         self.download_action.triggered.connect(window.download_files)
         self.download_action.setDisabled(True)
 
         self.refresh_action = QAction(self)
         self.refresh_action.setText("&Refresh")
-        self.refresh_action.setIcon(QIcon(resource_path('img/refresh.svg')))
+        self.refresh_action.setIcon(load_icon('img/refresh.svg'))
         self.refresh_action.triggered.connect(window.refresh)
 
         self.search_action = QAction(self)
         self.search_action.setText("&Search")
-        self.search_action.setIcon(QIcon(resource_path('img/search.svg')))
+        self.search_action.setIcon(load_icon('img/search.svg'))
         self.search_action.triggered.connect(window.search)
 
-        for action in (self.upload_action, self.create_action, self.delete_action,
-                       self.download_action, self.refresh_action, self.search_action):
+        self._actions = (self.upload_action, self.create_action, self.delete_action,
+                         self.download_action, self.refresh_action, self.search_action)
+        for action in self._actions:
             self.addAction(action)
+        # Enabled flags last pushed to self._actions, in the same order.
+        self._enabled = tuple(action.isEnabled() for action in self._actions)
 
     def update_state(self, rows: list):
         """Enable/disable actions based on the current tree selection."""
         if not rows:
-            self.upload_action.setDisabled(True)
-            self.create_action.setDisabled(False)
-            self.delete_action.setDisabled(True)
-            self.download_action.setDisabled(True)
-            self.refresh_action.setDisabled(False)
-            self.search_action.setDisabled(False)
+            self._apply(_ENABLED_NO_SELECTION)
             return
 
         def node_type(index):
             node = index.data(0x100)  # Qt.UserRole
             return node.s3_object.type if node else None
 
-        all_files = all(node_type(r) == ObjectType.FILE for r in rows)
-        single = len(rows) == 1
-        first_type = node_type(rows[0])
-
-        if all_files:
-            self.upload_action.setDisabled(True)
-            self.create_action.setDisabled(True)
-            self.delete_action.setDisabled(False)
-            self.download_action.setDisabled(False)
-            self.refresh_action.setDisabled(False)
-            self.search_action.setDisabled(False)
-        elif single and first_type in (ObjectType.BUCKET, ObjectType.FOLDER):
-            self.upload_action.setDisabled(False)
-            self.create_action.setDisabled(False)
-            self.delete_action.setDisabled(False)
-            self.download_action.setDisabled(True)
-            self.refresh_action.setDisabled(False)
-            self.search_action.setDisabled(False)
+        if len(rows) == 1:
+            self._apply(_ENABLED_BY_TYPE.get(node_type(rows[0]), _ENABLED_NO_SELECTION))
+        # Stops at the first non-file instead of typing the whole selection.
+        elif all(node_type(r) is ObjectType.FILE for r in rows):
+            self._apply(_ENABLED_FILES)
         else:
-            self.upload_action.setDisabled(True)
-            self.create_action.setDisabled(False)
-            self.delete_action.setDisabled(True)
-            self.download_action.setDisabled(True)
-            self.refresh_action.setDisabled(False)
-            self.search_action.setDisabled(False)
+            self._apply(_ENABLED_NO_SELECTION)
 
     def disable_search(self):
-        self.search_action.setDisabled(True)
+        self._apply(self._enabled[:-1] + (False,))
 
     def enable_search(self):
-        self.search_action.setDisabled(False)
+        self._apply(self._enabled[:-1] + (True,))
+
+    def _apply(self, enabled: tuple) -> None:
+        # Selecting between similar rows usually changes nothing; skip those calls.
+        for action, new, old in zip(self._actions, enabled, self._enabled):
+            if new != old:
+                action.setEnabled(new)
+        self._enabled = enabled
 
 
 class SettingsToolbar(QToolBar):
@@ -133,14 +136,14 @@ class SettingsToolbar(QToolBar):
 
         settings_action = QAction(self)
         settings_action.setText("&Settings")
-        settings_action.setIcon(QIcon(resource_path('img/settings.svg')))
-        settings_action.triggered.connect(window.open_settings)
+        settings_action.setIcon(load_icon('img/settings.svg'))
+        settings_action.triggered.connect(_deferred(window.open_settings))
         self.addAction(settings_action)
 
         about_action = QAction(self)
         about_action.setText("&About")
-        about_action.setIcon(QIcon(resource_path('img/about.svg')))
-        about_action.triggered.connect(window.open_about_window)
+        about_action.setIcon(load_icon('img/about.svg'))
+        about_action.triggered.connect(_deferred(window.open_about_window))
         self.addAction(about_action)
 
 
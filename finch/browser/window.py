@@ -2,12 +2,12 @@ import asyncio
 import functools
 import logging
 import os
+from typing import Dict, Optional
 
 log = logging.getLogger(__name__)
 
 from PySide6 import QtWidgets
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtCore import Qt, QItemSelection, QPersistentModelIndex, QPoint, QTimer, Slot
 from PySide6.QtWidgets import (
     QMainWindow, QTreeView, QVBoxLayout, QWidget,
     QMenu, QInputDialog, QMessageBox, QFileDialog,
@@ -26,12 +26,37 @@ from finch.transfers.upload import UploadDialog
 from finch.utils import async_slot
 from finch.utils.dialogs import TimeIntervalDialog
 from finch.utils.error import show_error_dialog
-from finch.utils.ui import center_window, resource_path
+from finch.utils.ui import center_window, load_icon
 from finch.browser.widgets.search import SearchWidget, SearchScope
 from finch.browser.widgets.spinner import QProgressIndicator
 from finch.browser.widgets.toolbars import init_toolbars
 
 
+# Context menu entries per node type: (label, icon, slot name), or
+# (label, icon, entries) for a submenu.
+_CONTEXT_MENUS = {
+    ObjectType.BUCKET: (
+        ("Delete Bucket", 'img/trash.svg', 'delete_bucket'),
+        ("Create Folder", 'img/new-folder.svg', 'create_folder'),
+        ("Tools", 'img/tools.svg', (
+            ("CORS Configurations", 'img/globe.svg', 'show_cors_window'),
+            ("ACL Configuration", 'img/tools.svg', 'show_acl_window'),
+        )),
+    ),
+    ObjectType.FOLDER: (
+        ("Delete Folder", 'img/trash.svg', 'delete_folder'),
+        ("Create Folder", 'img/new-folder.svg', 'create_folder'),
+    ),
+    ObjectType.FILE: (
+        ("Download File(s)", 'img/save.svg', 'download_files'),
+        ("Delete File", 'img/trash.svg', 'delete_file'),
+        ("Tools", 'img/tools.svg', (
+            ("Get Presigned Download URL", 'img/globe.svg', 'get_presigned_download_url'),
+        )),
+    ),
+}
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -42,6 +67,9 @@ class MainWindow(QMainWindow):
         self.search_widget = None
         self.tree_widget = None
         self.tree_model = None
+        self._context_menus: Dict[ObjectType, QMenu] = {}
+        self._selection_timer = QTimer(self, singleShot=True, interval=0)
+        self._selection_timer.timeout.connect(self._update_toolbar_state)
 
         self.creds_toolbar, self.file_toolbar, self.settings_toolbar = init_toolbars(self)
         self.creds_toolbar.credential_selector.currentIndexChanged.connect(self.on_credential_changed)
@@ -87,11 +115,15 @@ class MainWindow(QMainWindow):
 
     # ── Tree setup ─────────────────────────────────────────────────────────
 
-    def on_credential_changed(self, cred_index):
+    @async_slot
+    async def on_credential_changed(self, cred_index):
         if self.credential_selector.itemData(cred_index) != 0:
             try:
                 cred_name = self.credential_selector.itemText(cred_index)
                 cred = self.credentials_manager.get_credential(cred_name)
+                await asyncio.to_thread(s3_service.read_secret, cred)
+                if self.credential_selector.currentIndex() != cred_index:
+                    return  # another credential was picked while the keyring answered
                 s3_service.set_credential(cred)
                 self._reset_tree()
             except Exception as e:
@@ -104,14 +136,20 @@ class MainWindow(QMainWindow):
             self.tree_widget.customContextMenuRequested.connect(self._show_context_menu)
             self.tree_widget.setSortingEnabled(True)
             self.tree_widget.setSelectionMode(QTreeView.ExtendedSelection)
+            # Every row is one line with a small icon; skip per-row height queries.
+            self.tree_widget.setUniformRowHeights(True)
             header = self.tree_widget.header()
             header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
             header.setStretchLastSection(False)
             header.setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
             self.tree_widget_wrapper_lay.addWidget(self.tree_widget)
 
+        old_model, old_selection = self.tree_model, self.tree_widget.selectionModel()
         self.tree_model = S3FileTreeModel()
         self.tree_widget.setModel(self.tree_model)
+        if old_model is not None:
+            old_model.cancel()
+            old_selection.deleteLater()
         self.tree_widget.sortByColumn(0, Qt.AscendingOrder)
         self.tree_widget.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.tree_model.loading_started.connect(self.spinner.start)
@@ -132,7 +170,7 @@ class MainWindow(QMainWindow):
             node = rows[0].data(Qt.UserRole)
             if node and node.s3_object:
                 obj = node.s3_object
-                return obj.name if obj.type == ObjectType.BUCKET else obj.bucket_name
+                return obj.name if obj.type is ObjectType.BUCKET else obj.bucket_name
         return None
 
     def get_object_key_from_selected_item(self):
@@ -143,12 +181,19 @@ class MainWindow(QMainWindow):
                 return node.s3_object.key
         return None
 
+    @Slot(QItemSelection, QItemSelection)
     def _on_selection_changed(self, selected, deselected):
-        rows = self.tree_widget.selectionModel().selectedRows()
-        self.file_toolbar.update_state(rows)
+        # Shift-click and rubber-band selection emit in bursts; update once per tick.
+        self._selection_timer.start()
+
+    @Slot()
+    def _update_toolbar_state(self):
+        if self.tree_widget is not None:
+            self.file_toolbar.update_state(self.tree_widget.selectionModel().selectedRows())
 
     # ── Context menu ───────────────────────────────────────────────────────
 
+    @Slot(QPoint)
     def _show_context_menu(self, position):
         indexes = self.tree_widget.selectedIndexes()
         if not indexes:
@@ -156,61 +201,26 @@ class MainWindow(QMainWindow):
         node = indexes[0].data(Qt.UserRole)
         if not node:
             return
-        obj_type = node.s3_object.type
-
-        menu = QMenu()
-        if obj_type == ObjectType.BUCKET:
-            act = QAction("Delete Bucket")
-            act.setIcon(QIcon(resource_path('img/trash.svg')))
-            act.triggered.connect(self.delete_bucket)
-            menu.addAction(act)
-
-            act = QAction("Create Folder")
-            act.setIcon(QIcon(resource_path('img/new-folder.svg')))
-            act.triggered.connect(self.create_folder)
-            menu.addAction(act)
-
-            tools_menu = menu.addMenu("Tools")
-            tools_menu.setIcon(QIcon(resource_path('img/tools.svg')))
-            act = QAction("CORS Configurations", self)
-            act.setIcon(QIcon(resource_path('img/globe.svg')))
-            act.triggered.connect(self.show_cors_window)
-            tools_menu.addAction(act)
-            act = QAction("ACL Configuration", self)
-            act.setIcon(QIcon(resource_path('img/tools.svg')))
-            act.triggered.connect(self.show_acl_window)
-            tools_menu.addAction(act)
-
-        elif obj_type == ObjectType.FOLDER:
-            act = QAction("Delete Folder")
-            act.setIcon(QIcon(resource_path('img/trash.svg')))
-            act.triggered.connect(self.delete_folder)
-            menu.addAction(act)
-
-            act = QAction("Create Folder")
-            act.setIcon(QIcon(resource_path('img/new-folder.svg')))
-            act.triggered.connect(self.create_folder)
-            menu.addAction(act)
-
-        elif obj_type == ObjectType.FILE:
-            act = QAction("Download File(s)")
-            act.setIcon(QIcon(resource_path('img/save.svg')))
-            act.triggered.connect(self.download_files)
-            menu.addAction(act)
-
-            act = QAction("Delete File")
-            act.setIcon(QIcon(resource_path('img/trash.svg')))
-            act.triggered.connect(self.delete_file)
-            menu.addAction(act)
-
-            tools_menu = menu.addMenu("Tools")
-            tools_menu.setIcon(QIcon(resource_path('img/tools.svg')))
-            act = QAction("Get Presigned Download URL", self)
-            act.setIcon(QIcon(resource_path('img/globe.svg')))
-            act.triggered.connect(self.get_presigned_download_url)
-            tools_menu.addAction(act)
-
-        menu.exec(self.tree_widget.viewport().mapToGlobal(position))
+        menu = self._context_menu(node.s3_object.type)
+        if menu is not None:
+            menu.exec(self.tree_widget.viewport().mapToGlobal(position))
+
+    def _context_menu(self, obj_type: ObjectType) -> Optional[QMenu]:
+        """Return the context menu for obj_type, building it on first use."""
+        menu = self._context_menus.get(obj_type)
+        if menu is None and obj_type in _CONTEXT_MENUS:
+            menu = self._context_menus[obj_type] = self._build_menu(QMenu(self), _CONTEXT_MENUS[obj_type])
+        return menu
+
+    def _build_menu(self, menu: QMenu, entries: tuple) -> QMenu:
+        for label, icon_path, target in entries:
+            if isinstance(target, tuple):
+                submenu = menu.addMenu(load_icon(icon_path), label)
+                self._build_menu(submenu, target)
+            else:
+                action = menu.addAction(load_icon(icon_path), label)
+                action.triggered.connect(getattr(self, target))
+        return menu
 
     # ── S3 actions ─────────────────────────────────────────────────────────
 
@@ -266,7 +276,8 @@ class MainWindow(QMainWindow):
         dlg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         if dlg.exec() == QMessageBox.Yes:
             try:
-                await asyncio.to_thread(s3_service.delete_bucket, bucket_name)
+                with self.tree_model.busy():
+                    await asyncio.to_thread(s3_service.delete_bucket, bucket_name)
                 self.tree_model.remove_node(node)
             except Exception as e:
                 show_error_dialog(e, show_traceback=True)
@@ -276,7 +287,8 @@ class MainWindow(QMainWindow):
 
         node = self.get_selected_node()
         bucket_name = self.get_bucket_name_from_selected_item()
-        folder_key = self.get_object_key_from_selected_item()
+        # A compacted row ("a/b") also stands for its collapsed parent folders.
+        folder_key = node.folder_prefix
         dlg = QMessageBox(self)
         dlg.setIcon(QMessageBox.Warning)
         dlg.setWindowTitle("Warning")
@@ -284,7 +296,8 @@ class MainWindow(QMainWindow):
         dlg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         if dlg.exec() == QMessageBox.Yes:
             try:
-                await asyncio.to_thread(s3_service.delete_folder, bucket_name, folder_key)
+                with self.tree_model.busy():
+                    await asyncio.to_thread(s3_service.delete_folder, bucket_name, folder_key)
                 self.tree_model.remove_node(node)
             except Exception as e:
                 show_error_dialog(e, show_traceback=True)
@@ -302,7 +315,8 @@ class MainWindow(QMainWindow):
         dlg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         if dlg.exec() == QMessageBox.Yes:
             try:
-                await asyncio.to_thread(s3_service.delete_object, bucket_name, object_key)
+                with self.tree_model.busy():
+                    await asyncio.to_thread(s3_service.delete_object, bucket_name, object_key)
                 self.tree_model.remove_node(node)
             except Exception as e:
                 show_error_dialog(e, show_traceback=True)
@@ -322,31 +336,41 @@ class MainWindow(QMainWindow):
         rows = self.tree_widget.selectionModel().selectedRows()
         if not rows:
             return
-        nodes = [n for r in rows if (n := r.data(Qt.UserRole))]
-        if not nodes:
+        # Persistent indexes survive reloads/removals while the dialog and
+        # deletion run, and go invalid if their row disappears meanwhile.
+        staged = {}
+        file_nodes = []
+        for r in rows:
+            if n := r.data(Qt.UserRole):
+                staged[id(n)] = (n, QPersistentModelIndex(r))
+                if n.s3_object.type is ObjectType.FILE:
+                    file_nodes.append(n)
+        if not staged:
             return
+        model = self.tree_model
 
-        if len(nodes) == 1:
+        if len(staged) == 1:
+            (node, _), = staged.values()
             dispatch = {
                 ObjectType.BUCKET: self.delete_bucket,
                 ObjectType.FOLDER: self.delete_folder,
                 ObjectType.FILE:   self.delete_file,
             }
-            handler = dispatch.get(nodes[0].s3_object.type)
+            handler = dispatch.get(node.s3_object.type)
             if handler:
                 handler()
             return
 
-        file_nodes = self._remove_redundant_children(
-            [n for n in nodes if n.s3_object.type == ObjectType.FILE]
-        )
+        # Bulk delete only removes files, and a file never contains another,
+        # so the selection needs no nested-row filtering.
         if not file_nodes:
             return
 
-        names = [n.s3_object.name for n in file_nodes]
-        bullet_list = "\n".join(f"  - {n}" for n in names[:20])
-        suffix = f"\n  ... and {len(names) - 20} more" if len(names) > 20 else ""
-        msg = (f"The following {len(names)} files will be permanently deleted:\n\n"
+        # Only the first 20 names are shown; don't touch the rest.
+        total = len(file_nodes)
+        bullet_list = "\n".join(f"  - {n.s3_object.name}" for n in file_nodes[:20])
+        suffix = f"\n  ... and {total - 20} more" if total > 20 else ""
+        msg = (f"The following {total} files will be permanently deleted:\n\n"
                f"{bullet_list}{suffix}\n\nThis operation cannot be undone. Are you sure?")
         dlg = QMessageBox(self)
         dlg.setIcon(QMessageBox.Warning)
@@ -354,28 +378,26 @@ class MainWindow(QMainWindow):
         dlg.setText(msg)
         dlg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         if dlg.exec() == QMessageBox.Yes:
+            keys_by_bucket: dict = {}
+            for n in file_nodes:
+                keys_by_bucket.setdefault(n.s3_object.bucket_name, []).append(n.s3_object.key)
             try:
-                await asyncio.gather(*[
-                    asyncio.to_thread(s3_service.delete_object,
-                                      n.s3_object.bucket_name, n.s3_object.key)
-                    for n in file_nodes
-                ])
-                for n in file_nodes:
-                    self.tree_model.remove_node(n)
+                with model.busy():
+                    await asyncio.gather(*[
+                        asyncio.to_thread(s3_service.delete_objects, bucket, keys)
+                        for bucket, keys in keys_by_bucket.items()
+                    ])
+                if model is not self.tree_model:
+                    return
+                alive = [n for n in file_nodes if staged[id(n)][1].isValid()]
+                self.tree_widget.setUpdatesEnabled(False)
+                try:
+                    self.tree_model.remove_nodes(alive)
+                finally:
+                    self.tree_widget.setUpdatesEnabled(True)
             except Exception as e:
                 show_error_dialog(e, show_traceback=True)
 
-    @staticmethod
-    def _remove_redundant_children(nodes: list) -> list:
-        keys = {n.s3_object.key for n in nodes}
-        return [
-            node for node in nodes
-            if not any(
-                other != node.s3_object.key and node.s3_object.key.startswith(other)
-                for other in keys
-            )
-        ]
-
     # ── Transfers ──────────────────────────────────────────────────────────
 
     def upload_file(self) -> None:
@@ -383,34 +405,35 @@ class MainWindow(QMainWindow):
         if not node:
             return
         bucket_name = self.get_bucket_name_from_selected_item()
-        folder_key = node.s3_object.key if node.s3_object.type == ObjectType.FOLDER else None
+        folder_key = node.s3_object.key if node.s3_object.type is ObjectType.FOLDER else None
         file_dialog = QFileDialog()
         file_dialog.setWindowTitle("Select files to upload.")
         file_dialog.setFileMode(QFileDialog.ExistingFiles)
         if file_dialog.exec():
+            uploaded = []
             for file in file_dialog.selectedFiles():
                 file_name = os.path.basename(file)
                 folder = folder_key[:-1] if folder_key else None
                 s3_key = f"{folder}/{file_name}" if folder else file_name
 
-                def on_success(f=file, sk=s3_key, fn=file_name, fk=folder_key):
-                    parent_node = self.tree_model.find_node(bucket_name, fk or '')
-                    if parent_node is not None and parent_node.is_loaded:
-                        self.tree_model.insert_child(
-                            parent_node,
-                            S3Object(
-                                key=sk,
-                                name=fn,
-                                type=ObjectType.FILE,
-                                size=os.path.getsize(f),
-                                bucket_name=bucket_name,
-                            )
-                        )
+                def on_success(f=file, sk=s3_key, fn=file_name):
+                    uploaded.append(S3Object(
+                        key=sk,
+                        name=fn,
+                        type=ObjectType.FILE,
+                        size=os.path.getsize(f),
+                        bucket_name=bucket_name,
+                    ))
 
                 self.upload_dialog = UploadDialog(file, bucket_name, folder_key,
                                                   on_success=on_success)
                 self.upload_dialog.exec()
 
+            # Add every uploaded file in one row insertion once the dialogs are done.
+            parent_node = self.tree_model.find_node(bucket_name, folder_key or '')
+            if uploaded and parent_node is not None and parent_node.is_loaded:
+                self.tree_model.insert_children(parent_node, uploaded)
+
     def download_files(self) -> None:
         rows = self.tree_widget.selectionModel().selectedRows()
         if not rows:
@@ -418,7 +441,7 @@ class MainWindow(QMainWindow):
         file_list = [
             (node.s3_object.bucket_name, node.s3_object.key)
             for row in rows
-            if (node := row.data(Qt.UserRole)) and node.s3_object.type == ObjectType.FILE
+            if (node := row.data(Qt.UserRole)) and node.s3_object.type is ObjectType.FILE
         ]
         if not file_list:
             return
@@ -433,7 +456,7 @@ class MainWindow(QMainWindow):
         rows = self.tree_widget.selectionModel().selectedRows()
         if rows:
             node = rows[0].data(Qt.UserRole)
-            if node and node.s3_object.type == ObjectType.BUCKET:
+            if node and node.s3_object.type is ObjectType.BUCKET:
                 self.cors_window = CORSWindow(bucket_name=self.get_bucket_name_from_selected_item())
                 self.cors_window.show()
 
@@ -441,7 +464,7 @@ class MainWindow(QMainWindow):
         rows = self.tree_widget.selectionModel().selectedRows()
         if rows:
             node = rows[0].data(Qt.UserRole)
-            if node and node.s3_object.type == ObjectType.BUCKET:
+            if node and node.s3_object.type is ObjectType.BUCKET:
                 self.acl_window = ACLWindow(bucket_name=self.get_bucket_name_from_selected_item())
                 self.acl_window.show()
 
@@ -452,7 +475,7 @@ class MainWindow(QMainWindow):
         if not rows:
             return
         node = rows[0].data(Qt.UserRole)
-        if not node or node.s3_object.type != ObjectType.FILE:
+        if not node or node.s3_object.type is not ObjectType.FILE:
             return
         bucket_name = self.get_bucket_name_from_selected_item()
         file_key = self.get_object_key_from_selected_item()
@@ -485,9 +508,9 @@ class MainWindow(QMainWindow):
                 if not node or not node.s3_object:
                     continue
                 obj = node.s3_object
-                if obj.type == ObjectType.BUCKET:
+                if obj.type is ObjectType.BUCKET:
                     scopes.append(SearchScope(bucket_name=obj.name))
-                elif obj.type == ObjectType.FOLDER:
+                elif obj.type is ObjectType.FOLDER:
                     scopes.append(SearchScope(bucket_name=obj.bucket_name, prefix=obj.key))
         self.search_widget = SearchWidget(main_widget=self, scopes=scopes)
         self.file_toolbar.disable_search()
@@ -9,6 +9,24 @@ from pathlib import Path
 CONFIG_PATH   = str(Path.home() / ".config" / "finch")
 SETTINGS_FILE = os.path.join(CONFIG_PATH, "settings.json")
 
+# Worker threads for concurrent S3 requests; S3 calls are latency-bound.
+THREAD_POOL_SIZE = 16
+
+
+def write_json_atomic(path: str, data, **dump_kwargs) -> None:
+    """Write data as JSON to path; a crash mid-write leaves the old file intact."""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
 class ObjectType(str, Enum):
     BUCKET = "Bucket"
@@ -22,6 +40,7 @@ class Settings:
 
     check_folder_contents: bool = True
     native_file_icons:     bool = True
+    compact_single_child_chains: bool = False
     datetime_format:       str  = "%d %b %Y %H:%M"
 
     logging_enabled: bool = False
@@ -46,6 +65,8 @@ class Settings:
             return
         self.check_folder_contents = bool(data.get("check_folder_contents", self.check_folder_contents))
         self.native_file_icons     = bool(data.get("native_file_icons", self.native_file_icons))
+        self.compact_single_child_chains = bool(data.get("compact_single_child_chains",
+                                                         self.compact_single_child_chains))
         self.datetime_format       = data.get("datetime_format", self.datetime_format)
         self.logging_enabled       = bool(data.get("logging_enabled", self.logging_enabled))
         self.logging_to_file       = bool(data.get("logging_to_file", self.logging_to_file))
@@ -53,16 +74,16 @@ class Settings:
         self.logger_levels.update(data.get("logger_levels", {}))
 
     def save(self) -> None:
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump({
-                "check_folder_contents": self.check_folder_contents,
-                "native_file_icons":     self.native_file_icons,
-                "datetime_format":       self.datetime_format,
-                "logging_enabled":       self.logging_enabled,
-                "logging_to_file":       self.logging_to_file,
-                "log_file_path":         self.log_file_path,
-                "logger_levels":         self.logger_levels,
-            }, f, indent=2)
+        write_json_atomic(SETTINGS_FILE, {
+            "check_folder_contents": self.check_folder_contents,
+            "native_file_icons":     self.native_file_icons,
+            "compact_single_child_chains": self.compact_single_child_chains,
+            "datetime_format":       self.datetime_format,
+            "logging_enabled":       self.logging_enabled,
+            "logging_to_file":       self.logging_to_file,
+            "log_file_path":         self.log_file_path,
+            "logger_levels":         self.logger_levels,
+        }, indent=2)
 
     def apply_logging(self) -> None:
         root = logging.getLogger()
@@ -1,17 +1,55 @@
+import bisect
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
-from threading import local
-from typing import Callable, List, Optional
+from itertools import islice
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
 
 import boto3
 import keyring
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from slugify import slugify
 
-from finch.config import ObjectType
+from finch.config import ObjectType, THREAD_POOL_SIZE
 from finch.utils.text import key_display_name
 
+# S3 DeleteObjects accepts at most 1000 keys per request.
+DELETE_BATCH_SIZE = 1000
+
+# Keys per listing request; 1000 is the most S3 returns.
+LIST_PAGE_SIZE = 1000
+
+# Error codes from S3-compatible backends that do not implement DeleteObjects.
+_BATCH_DELETE_UNSUPPORTED = {'NotImplemented', 'MethodNotAllowed'}
+
+# Sub-folders a recursive walk lists with their own delimited requests. Past
+# that, a page's sub-folders are read with one flat listing instead, so a wide
+# tree with few keys per folder costs pages of keys, not a request per folder.
+WALK_SPLIT_BUDGET = 4 * THREAD_POOL_SIZE
+
+# Seconds a recursive listing is reused before S3 is walked again.
+INVENTORY_TTL = 60
+
+# One client serves every thread: enough pooled keep-alive connections for the
+# shared executor and the fan-out pool to run at once without new TLS handshakes.
+# Standard retries back off on SlowDown/throttling, which fan-out can trigger.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=2 * THREAD_POOL_SIZE,
+    tcp_keepalive=True,
+    retries={'mode': 'standard'},
+)
+
+# Folder emptiness answers kept across tree reloads, and for how long.
+EMPTINESS_CACHE_SIZE = 10000
+EMPTINESS_TTL = 300
 
-@dataclass
+
+@dataclass(slots=True)
 class S3Object:
     key: str
     name: str
@@ -24,33 +62,72 @@ class S3Object:
 class S3Service:
     def __init__(self):
         self._credentials: Optional[dict] = None
-        self._thread_local = local()
+        self._client = None
+        self._client_lock = Lock()
         self._cred_version: int = 0
+        self._batch_delete_supported: bool = True
+        # Long-lived threads for fan-out helpers (recursive walks, per-key
+        # deletes), so concurrent calls can't multiply threads or pay to start them.
+        self._request_pool = ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE,
+                                                thread_name_prefix="finch-fanout")
+        # bucket -> prefix -> (fetched at, sorted keys, entries in key order)
+        self._inventory: Dict[str, Dict[str, Tuple[float, List[str], List[dict]]]] = {}
+        self._inventory_lock = Lock()
+        # (bucket, folder key) -> (checked at, is empty), least recently used first
+        self._emptiness: OrderedDict[Tuple[str, str], Tuple[float, bool]] = OrderedDict()
+        self._emptiness_lock = Lock()
+        # Identical requests in flight; later callers wait on the first one's result.
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = Lock()
+        # (keyring service, access key) -> secret, so switching back to a
+        # credential doesn't go through the OS keychain again.
+        self._secrets: Dict[Tuple[str, str], Optional[str]] = {}
 
     @property
     def client(self):
-        """Thread-local boto3 client — recreated when credentials change."""
-        tl = self._thread_local
-        if (not hasattr(tl, 'client') or tl.client is None
-                or getattr(tl, 'cred_version', -1) != self._cred_version):
-            if self._credentials is None:
-                raise RuntimeError("No credentials set. Call set_credential() first.")
-            tl.client = boto3.client('s3', **self._credentials)
-            tl.cred_version = self._cred_version
-        return tl.client
+        """Shared boto3 client (thread-safe) — recreated when credentials change."""
+        client = self._client
+        if client is None:
+            # Client creation itself is not thread-safe; build it once.
+            with self._client_lock:
+                if self._client is None:
+                    if self._credentials is None:
+                        raise RuntimeError("No credentials set. Call set_credential() first.")
+                    self._client = boto3.client('s3', config=_CLIENT_CONFIG, **self._credentials)
+                client = self._client
+        return client
 
     def set_credential(self, credential: dict) -> None:
-        """Switch the active credential — all thread-local clients will be recreated."""
+        """Switch the active credential — the shared client will be recreated."""
         self._credentials = {
             'endpoint_url': credential.get('endpoint') or None,
             'aws_access_key_id': credential.get('access_key'),
-            'aws_secret_access_key': keyring.get_password(
-                f'{slugify(credential["name"])}@finch',
-                credential.get('access_key'),
-            ),
+            'aws_secret_access_key': self.read_secret(credential),
             'region_name': credential.get('region') or None,
         }
+        with self._client_lock:
+            self._client = None
         self._cred_version += 1
+        self._batch_delete_supported = True
+        with self._inventory_lock:
+            self._inventory.clear()
+        with self._emptiness_lock:
+            self._emptiness.clear()
+
+    def read_secret(self, credential: dict) -> Optional[str]:
+        """Return credential's secret key from the keyring, remembering it.
+
+        The first read is an IPC round-trip to the OS secret store; callers
+        on the GUI thread can warm it from a worker before set_credential().
+        """
+        key = (f'{slugify(credential["name"])}@finch', credential.get('access_key'))
+        if key not in self._secrets:
+            self._secrets[key] = keyring.get_password(*key)
+        return self._secrets[key]
+
+    def forget_secrets(self) -> None:
+        """Drop remembered keyring secrets after the stored credentials change."""
+        self._secrets.clear()
 
     # ── Listing ────────────────────────────────────────────────────────────
 
@@ -66,31 +143,207 @@ class S3Service:
             for b in response.get('Buckets', [])
         ]
 
-    def list_objects(self, bucket: str, prefix: str = '') -> List[S3Object]:
-        resp = self.client.list_objects(Bucket=bucket, Prefix=prefix, Delimiter='/')
-        results: List[S3Object] = []
-        for cp in resp.get('CommonPrefixes', []):
-            key = cp['Prefix']
-            results.append(S3Object(
-                key=key,
-                name=key_display_name(key),
-                type=ObjectType.FOLDER,
-                bucket_name=bucket,
-            ))
-        for obj in resp.get('Contents', []):
+    def list_objects(self, bucket: str, prefix: str = '',
+                     continuation_token: Optional[str] = None,
+                     start_after: Optional[str] = None) -> List[S3Object]:
+        """Return one page of the folders and files directly under prefix.
+
+        continuation_token resumes a previous listing; start_after skips
+        every key up to and including the given one.
+        """
+        kwargs = self._listing_args(bucket, prefix, start_after)
+        if continuation_token:
+            kwargs['ContinuationToken'] = continuation_token
+        resp = self.client.list_objects_v2(MaxKeys=LIST_PAGE_SIZE, **kwargs)
+        return self._page_objects(bucket, prefix, resp)
+
+    def iter_objects(self, bucket: str, prefix: str = '',
+                     start_after: Optional[str] = None) -> Iterator[List[S3Object]]:
+        """Yield the folders and files directly under prefix, one page at a time."""
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(**self._listing_args(bucket, prefix, start_after),
+                                       PaginationConfig={'PageSize': LIST_PAGE_SIZE}):
+            yield self._page_objects(bucket, prefix, page)
+
+    @staticmethod
+    def _listing_args(bucket: str, prefix: str, start_after: Optional[str]) -> dict:
+        kwargs = {'Bucket': bucket, 'Prefix': prefix, 'Delimiter': '/'}
+        if start_after:
+            kwargs['StartAfter'] = start_after
+        return kwargs
+
+    @staticmethod
+    def _page_objects(bucket: str, prefix: str, page: dict) -> List[S3Object]:
+        # Fields are passed positionally (key, name, type, size, last_modified,
+        # bucket_name): keyword binding doubles the cost on 1000-entry pages.
+        folder, file = ObjectType.FOLDER, ObjectType.FILE
+        results: List[S3Object] = [
+            S3Object(key, key_display_name(key), folder, 0, None, bucket)
+            for key in (cp['Prefix'] for cp in page.get('CommonPrefixes', []))
+        ]
+        for obj in page.get('Contents', []):
             key = obj['Key']
             if key == prefix:
                 continue  # skip folder marker itself
-            results.append(S3Object(
-                key=key,
-                name=key_display_name(key),
-                type=ObjectType.FILE,
-                size=obj['Size'],
-                last_modified=obj['LastModified'],
-                bucket_name=bucket,
-            ))
+            results.append(S3Object(key, key_display_name(key), file,
+                                    obj['Size'], obj['LastModified'], bucket))
         return results
 
+    def walk_objects(self, bucket: str, prefix: str = '') -> Iterator[dict]:
+        """Yield every raw object entry under prefix, recursively.
+
+        Every delimited ListObjectsV2 page is its own request: as soon as a
+        page arrives its sub-folders and its next page are submitted to the
+        request pool, so deep trees are listed concurrently instead of one
+        round-trip at a time. Once WALK_SPLIT_BUDGET sub-folders have been
+        split off, a page's sub-folders are covered by one flat listing of
+        their key range instead. Order is not defined.
+        """
+        pool = self._request_pool
+        budget = WALK_SPLIT_BUDGET
+        # Future -> the job it runs, resubmitted with the page's continuation token.
+        pending: Dict[Future, tuple] = {}
+
+        def submit(job: tuple, token: Optional[str] = None) -> None:
+            pending[pool.submit(*job, token)] = job
+
+        submit((self._list_page, bucket, prefix))
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    contents, prefixes, token = future.result()
+                    if token:
+                        submit(job, token)
+                    if len(prefixes) <= budget:
+                        budget -= len(prefixes)
+                        for p in prefixes:
+                            submit((self._list_page, bucket, p))
+                    else:
+                        submit((self._list_range, bucket, job[2], prefixes[0], prefixes[-1]))
+                    yield from contents
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _list_page(self, bucket: str, prefix: str,
+                   token: Optional[str] = None) -> Tuple[List[dict], List[str], Optional[str]]:
+        """Fetch one delimited page: (contents, sub-folder prefixes, next token)."""
+        kwargs = {'Bucket': bucket, 'Prefix': prefix, 'Delimiter': '/'}
+        if token:
+            kwargs['ContinuationToken'] = token
+        page = self.client.list_objects_v2(**kwargs)
+        return (
+            page.get('Contents', []),
+            [cp['Prefix'] for cp in page.get('CommonPrefixes', [])],
+            page.get('NextContinuationToken') if page.get('IsTruncated') else None,
+        )
+
+    def _list_range(self, bucket: str, prefix: str, first: str, last: str,
+                    token: Optional[str] = None) -> Tuple[List[dict], List[str], Optional[str]]:
+        """Fetch one flat page of the keys inside sub-folders first..last of prefix.
+
+        Keys directly under prefix are skipped; the delimited pages of prefix
+        already yield them. Returns no token once the listing passes last.
+        """
+        kwargs = {'Bucket': bucket, 'Prefix': prefix, 'MaxKeys': LIST_PAGE_SIZE}
+        if token:
+            kwargs['ContinuationToken'] = token
+        else:
+            kwargs['StartAfter'] = first[:-1]
+        page = self.client.list_objects_v2(**kwargs)
+        start = len(prefix)
+        contents = []
+        for obj in page.get('Contents', []):
+            key = obj['Key']
+            if key > last and not key.startswith(last):
+                return contents, [], None
+            if key >= first and key.find('/', start) != -1:
+                contents.append(obj)
+        return contents, [], page.get('NextContinuationToken') if page.get('IsTruncated') else None
+
+    def list_inventory(self, bucket: str, prefix: str = '') -> List[dict]:
+        """Return every raw object entry under prefix, sorted by key.
+
+        Walks are kept for INVENTORY_TTL seconds; a cached walk of an
+        enclosing prefix answers narrower queries with a bisect over its keys.
+        Changes made through this service drop the bucket's entries.
+        """
+        now = time.monotonic()
+        with self._inventory_lock:
+            cached = list(self._inventory.get(bucket, {}).items())
+        for cached_prefix, (fetched, keys, entries) in cached:
+            if now - fetched < INVENTORY_TTL and prefix.startswith(cached_prefix):
+                lo = bisect.bisect_left(keys, prefix)
+                hi = bisect.bisect_left(keys, prefix + '\U0010ffff')
+                return entries[lo:hi]
+
+        entries = sorted(self.walk_objects(bucket, prefix), key=lambda o: o['Key'])
+        with self._inventory_lock:
+            self._inventory.setdefault(bucket, {})[prefix] = (
+                now, [o['Key'] for o in entries], entries,
+            )
+        return entries
+
+    def _invalidate(self, bucket: str) -> None:
+        """Drop everything cached about bucket after a change made through this service."""
+        with self._inventory_lock:
+            self._inventory.pop(bucket, None)
+        with self._emptiness_lock:
+            for key in [k for k in self._emptiness if k[0] == bucket]:
+                del self._emptiness[key]
+
+    def _coalesce(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """Run call once for concurrent callers sharing key; all get its result.
+
+        Keys include the credential version, so a request made with replaced
+        credentials is never shared with the new ones.
+        """
+        key = (self._cred_version, key)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _cached_emptiness(self, bucket: str, folders: List[str]) -> Dict[str, bool]:
+        now = time.monotonic()
+        found: Dict[str, bool] = {}
+        with self._emptiness_lock:
+            for folder in folders:
+                entry = self._emptiness.get((bucket, folder))
+                if entry is None:
+                    continue
+                if now - entry[0] >= EMPTINESS_TTL:
+                    del self._emptiness[(bucket, folder)]
+                    continue
+                self._emptiness.move_to_end((bucket, folder))
+                found[folder] = entry[1]
+        return found
+
+    def _remember_emptiness(self, bucket: str, results: Dict[str, bool]) -> None:
+        now = time.monotonic()
+        with self._emptiness_lock:
+            for folder, is_empty in results.items():
+                self._emptiness[(bucket, folder)] = (now, is_empty)
+                self._emptiness.move_to_end((bucket, folder))
+            while len(self._emptiness) > EMPTINESS_CACHE_SIZE:
+                self._emptiness.popitem(last=False)
+
     # ── Create ─────────────────────────────────────────────────────────────
 
     def create_bucket(self, name: str) -> None:
@@ -100,35 +353,167 @@ class S3Service:
         if not key.endswith('/'):
             key += '/'
         self.client.put_object(Bucket=bucket, Key=key)
+        self._invalidate(bucket)
 
     # ── Delete ─────────────────────────────────────────────────────────────
 
     def delete_object(self, bucket: str, key: str) -> None:
         self.client.delete_object(Bucket=bucket, Key=key)
+        self._invalidate(bucket)
+
+    def delete_objects(self, bucket: str, keys: Iterable[str]) -> None:
+        """Delete keys with one DeleteObjects request per 1000 keys, several at once."""
+        self._delete_batches(bucket, self._batched({'Key': k} for k in keys))
+
+    def _delete_batches(self, bucket: str, batches: Iterable[List[dict]]) -> None:
+        """Delete batches of at most 1000 objects as they are produced.
+
+        The first DeleteObjects request runs on the calling thread to find out
+        whether the backend supports it; the rest go to the request pool so
+        several batches are in flight while the producer keeps listing.
+        Backends without DeleteObjects get one request per object instead.
+        """
+        self._invalidate(bucket)
+        futures = []
+        probed = False
+        try:
+            for objects in batches:
+                if not objects:
+                    continue
+                if not self._batch_delete_supported:
+                    self._delete_each(bucket, objects)
+                elif probed:
+                    futures.append(self._request_pool.submit(self._delete_batch, bucket, objects))
+                else:
+                    probed = True
+                    try:
+                        self._delete_batch(bucket, objects)
+                    except ClientError as e:
+                        if e.response.get('Error', {}).get('Code') not in _BATCH_DELETE_UNSUPPORTED:
+                            raise
+                        self._batch_delete_supported = False
+                        self._delete_each(bucket, objects)
+            self._wait_all(futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def _delete_batch(self, bucket: str, objects: List[dict]) -> None:
+        resp = self.client.delete_objects(
+            Bucket=bucket, Delete={'Objects': objects, 'Quiet': True},
+        )
+        errors = resp.get('Errors', [])
+        if errors:
+            err = errors[0]
+            raise RuntimeError(
+                f"Failed to delete {len(errors)} object(s), "
+                f"first: {err.get('Key')} ({err.get('Code')}: {err.get('Message')})"
+            )
+
+    def _delete_each(self, bucket: str, objects: List[dict]) -> None:
+        """Delete objects with one request each, THREAD_POOL_SIZE at a time."""
+        client = self.client
+        self._wait_all([self._request_pool.submit(client.delete_object, Bucket=bucket, **obj)
+                        for obj in objects])
+
+    @staticmethod
+    def _wait_all(futures: List[Future]) -> None:
+        """Wait for futures, cancelling the ones not yet started if any fails."""
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
     def delete_folder(self, bucket: str, prefix: str) -> None:
         paginator = self.client.get_paginator('list_objects_v2')
-        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-            for obj in page.get('Contents', []):
-                self.client.delete_object(Bucket=bucket, Key=obj['Key'])
+        self._delete_batches(bucket, self._batched(
+            {'Key': obj['Key']}
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+            for obj in page.get('Contents', [])
+        ))
 
     def delete_bucket(self, bucket: str) -> None:
         versioning = self.client.get_bucket_versioning(Bucket=bucket)
         if versioning.get('Status') == 'Enabled':
             paginator = self.client.get_paginator('list_object_versions')
-            for page in paginator.paginate(Bucket=bucket):
-                for v in page.get('Versions', []):
-                    self.client.delete_object(Bucket=bucket, Key=v['Key'], VersionId=v['VersionId'])
-                for m in page.get('DeleteMarkers', []):
-                    self.client.delete_object(Bucket=bucket, Key=m['Key'], VersionId=m['VersionId'])
+            self._delete_batches(bucket, self._batched(
+                {'Key': v['Key'], 'VersionId': v['VersionId']}
+                for page in paginator.paginate(Bucket=bucket)
+                for v in page.get('Versions', []) + page.get('DeleteMarkers', [])
+            ))
         else:
             self.delete_folder(bucket, '')
         self.client.delete_bucket(Bucket=bucket)
+        self._invalidate(bucket)
+
+    @staticmethod
+    def _batched(objects: Iterable[dict]) -> Iterator[List[dict]]:
+        """Group objects into full DeleteObjects batches, however they were paged."""
+        objects = iter(objects)
+        while batch := list(islice(objects, DELETE_BATCH_SIZE)):
+            yield batch
 
     def is_bucket_empty(self, bucket: str) -> bool:
         resp = self.client.list_objects_v2(Bucket=bucket, MaxKeys=1)
         return resp.get('KeyCount', 0) == 0
 
+    def is_folder_empty(self, bucket: str, prefix: str) -> bool:
+        """Return True if nothing but the folder's own marker lives under prefix.
+
+        Two keys are enough to tell, so this never pages through a folder.
+        Answers are cached for EMPTINESS_TTL seconds.
+        """
+        cached = self._cached_emptiness(bucket, [prefix])
+        if prefix in cached:
+            return cached[prefix]
+
+        def probe() -> bool:
+            resp = self.client.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=2)
+            is_empty = all(obj['Key'] == prefix for obj in resp.get('Contents', []))
+            self._remember_emptiness(bucket, {prefix: is_empty})
+            return is_empty
+
+        return self._coalesce(('is_folder_empty', bucket, prefix), probe)
+
+    def probe_folders(self, bucket: str, prefix: str, folders: List[str]) -> Dict[str, bool]:
+        """Tell which sub-folders of prefix are empty from one listing request.
+
+        Lists a page of keys under prefix without a delimiter. Keys come back
+        sorted, so every folder the page has moved past is settled: True if
+        only its own marker was seen, False if anything below it was. Folders
+        beyond a truncated page are left out for the caller to probe singly.
+        Answers are cached, and no request is made if all folders are cached.
+        """
+        cached = self._cached_emptiness(bucket, folders)
+        folders = [f for f in folders if f not in cached]
+        if not folders:
+            return cached
+        resp = self.client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+        contents = resp.get('Contents', [])
+        populated = set()
+        start = len(prefix)
+        for obj in contents:
+            key = obj['Key']
+            slash = key.find('/', start)
+            if slash != -1 and slash != len(key) - 1:
+                populated.add(key[:slash + 1])
+        truncated = resp.get('IsTruncated', False)
+        if truncated and not contents:
+            return {}
+        last = contents[-1]['Key'] if truncated else None
+        result: Dict[str, bool] = {}
+        for folder in folders:
+            if folder in populated:
+                result[folder] = False
+            elif last is None or (folder < last and not last.startswith(folder)):
+                result[folder] = True
+        self._remember_emptiness(bucket, result)
+        return {**cached, **result}
+
     # ── Presigned URL ──────────────────────────────────────────────────────
 
     def generate_presigned_url(self, bucket: str, key: str, expiry: int) -> str:
@@ -164,6 +549,7 @@ class S3Service:
                        callback: Optional[Callable] = None) -> None:
         self.client.upload_fileobj(file_obj, bucket, key,
                                    Callback=callback if callback else None)
+        self._invalidate(bucket)
 
     def get_object_size(self, bucket: str, key: str) -> int:
         return self.client.head_object(Bucket=bucket, Key=key)['ContentLength']
@@ -1,48 +1,107 @@
 import json
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 
 import keyring
 from slugify import slugify
 
-from finch.config import CONFIG_PATH
+from finch.config import CONFIG_PATH, write_json_atomic
+from finch.s3 import s3_service
 from finch.utils.error import show_error_dialog
 
 
 # Column definitions shared with the Qt model: (internal_key, display_name).
 # Order determines column order in the table view.
-COLUMNS = [
+COLUMNS = (
     ("name",       "Credential Name"),
     ("endpoint",   "Service Endpoint"),
     ("access_key", "Access Key"),
     ("secret_key", "Secret Key"),
     ("region",     "Region"),
-]
+)
+# Internal keys by column index; looked up on every cell access.
+COLUMN_KEYS = tuple(key for key, _ in COLUMNS)
+# Columns that must be non-blank on save; stored secrets are loaded lazily.
+_REQUIRED_COLUMNS = tuple((key, display) for key, display in COLUMNS if key != "secret_key")
 
-_SECRET_PLACEHOLDER = "xxx"
+# Field values for a freshly added credential row.
+_DEFAULT_ROW = MappingProxyType({
+    "name":       "",
+    "endpoint":   "https://s3.amazonaws.com",
+    "access_key": "",
+    "secret_key": "",
+    "region":     "us-east-1",
+})
+
+# Concurrent keyring calls when saving; backends serialize beyond a few.
+_KEYRING_WORKERS = 4
+
+# slugify normalizes and runs several regexes; names repeat constantly.
+_slug = lru_cache(maxsize=256)(slugify)
+
+
+def _keyring_service(name: str) -> str:
+    return f'{_slug(name)}@finch'
+
+
+def _delete_secret(service: str, access_key: str) -> None:
+    if keyring.get_password(service, access_key) is not None:
+        keyring.delete_password(service, access_key)
 
 
 class CredentialsManager:
     """Reads and writes credentials.json; secrets are stored in the system keyring."""
 
+    # Parsed credentials.json shared by all instances, keyed on the file's mtime.
+    _cache_mtime: Optional[int] = None
+    _cache_data: List[dict] = []
+
     def __init__(self):
+        self.credentials: List[dict] = list(self._load())
+        # name -> first credential with that name, built on first lookup.
+        self._by_name: Optional[Dict[str, dict]] = None
+
+    @classmethod
+    def _load(cls) -> List[dict]:
         path = os.path.join(CONFIG_PATH, "credentials.json")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == cls._cache_mtime:
+            return cls._cache_data
         with open(path, "r") as f:
-            try:
-                self.credentials: List[dict] = json.loads(f.read())
-            except json.JSONDecodeError:
-                self.credentials = []
+            raw = f.read()
+        # A fresh install touches an empty file; don't raise and catch for it.
+        try:
+            data = json.loads(raw) if raw.strip() else []
+        except json.JSONDecodeError:
+            data = []
+        cls._cache_mtime, cls._cache_data = mtime, data
+        return data
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cache_mtime = None
+        cls._cache_data = []
 
     def get_credential(self, name: str) -> dict:
-        matches = [c for c in self.credentials if c["name"] == name]
-        return matches[0] if matches else {}
+        if self._by_name is None:
+            self._by_name = {}
+            for cred in self.credentials:
+                self._by_name.setdefault(cred["name"], cred)
+        return self._by_name.get(name, {})
 
     def get_credentials(self) -> List[dict]:
         return self.credentials
 
     def save_credentials(self, credentials: List[dict]) -> None:
-        with open(os.path.join(CONFIG_PATH, "credentials.json"), "w") as f:
-            json.dump(credentials, f)
+        write_json_atomic(os.path.join(CONFIG_PATH, "credentials.json"), credentials)
+        # mtime granularity can hide a same-tick rewrite; force the next read.
+        self.clear_cache()
 
     def list_credentials_names(self) -> List[str]:
         return sorted(c["name"] for c in self.credentials)
@@ -52,56 +111,124 @@ class CredentialsDraft:
     """In-memory staging buffer for editing credentials before persisting.
 
     Rows are stored with internal keys (matching credentials.json).
-    The secret_key field is masked with a placeholder for existing credentials.
+    Existing credentials are loaded without a secret_key; their secret stays
+    in the keyring until get_secret() asks for it.
     """
 
     def __init__(self):
         self._rows: List[dict] = []
         self._deleted: List[dict] = []
+        # slug(name) -> row dict, so duplicate checks don't re-slugify every row.
+        self._slug_index: Dict[str, dict] = {}
+        # (keyring service, access_key) -> secret as last read from/written to the keyring.
+        self._secret_cache: Dict[Tuple[str, str], Optional[str]] = {}
 
         for cred in CredentialsManager().get_credentials():
-            self._rows.append({**cred, "secret_key": _SECRET_PLACEHOLDER})
+            row = dict(cred)
+            self._rows.append(row)
+            self._index_name(row)
 
     def row_count(self) -> int:
         return len(self._rows)
 
     def get_value(self, row: int, col: int) -> str:
-        return self._rows[row].get(COLUMNS[col][0], "")
+        return self._rows[row].get(COLUMN_KEYS[col], "")
 
     def set_value(self, row: int, col: int, value: str) -> None:
-        self._rows[row][COLUMNS[col][0]] = value
+        data = self._rows[row]
+        key = COLUMN_KEYS[col]
+        if key == "name":
+            self._unindex_name(data)
+        data[key] = value
+        if key == "name":
+            self._index_name(data)
+
+    def has_secret(self, row: int) -> bool:
+        """Return True if row has a secret, without touching the keyring."""
+        data = self._rows[row]
+        return "secret_key" not in data or bool(data["secret_key"])
+
+    def get_secret(self, row: int) -> str:
+        """Return the row's secret, reading it from the keyring on first use."""
+        data = self._rows[row]
+        if "secret_key" in data:
+            return data["secret_key"]
+        key = (_keyring_service(data["name"]), data["access_key"])
+        if key not in self._secret_cache:
+            self._secret_cache[key] = keyring.get_password(*key)
+        return self._secret_cache[key] or ""
+
+    def has_duplicate_name(self, row: int, name: str) -> bool:
+        """Return True if a row other than row already uses name (compared by slug)."""
+        owner = self._slug_index.get(_slug(name))
+        return owner is not None and owner is not self._rows[row]
 
     def insert_row(self) -> None:
-        self._rows.append({
-            "name":       "",
-            "endpoint":   "https://s3.amazonaws.com",
-            "access_key": "",
-            "secret_key": "",
-            "region":     "us-east-1",
-        })
+        self._rows.append(dict(_DEFAULT_ROW))
+
+    def insert_rows(self, rows: List[dict]) -> None:
+        """Append rows, filling unspecified fields with the defaults."""
+        for values in rows:
+            row = {**_DEFAULT_ROW, **values}
+            self._rows.append(row)
+            self._index_name(row)
 
     def delete_row(self, index: int) -> None:
-        self._deleted.append(self._rows.pop(index))
+        row = self._rows.pop(index)
+        self._unindex_name(row)
+        self._deleted.append(row)
+
+    def _index_name(self, row: dict) -> None:
+        if row.get("name"):
+            self._slug_index.setdefault(_slug(row["name"]), row)
+
+    def _unindex_name(self, row: dict) -> None:
+        if row.get("name"):
+            slug = _slug(row["name"])
+            if self._slug_index.get(slug) is row:
+                del self._slug_index[slug]
+
+    def validate(self) -> None:
+        """Raise ValueError if any required field is blank."""
+        for i, row in enumerate(self._rows):
+            for key, display in _REQUIRED_COLUMNS:
+                value = row.get(key)
+                if not isinstance(value, str) or not value.strip():
+                    raise ValueError(f"'{display}' cannot be empty (row {i + 1})")
 
     def persist(self) -> None:
-        """Write secrets to keyring and save credential metadata to disk."""
+        """Write secrets to keyring and save credential metadata to disk.
+
+        Keyring calls are IPC round-trips to the OS secret store, so they run
+        concurrently; failures are reported here, on the calling thread.
+        """
         to_save = []
+        writes = []
         for row in self._rows:
-            if row["secret_key"] != _SECRET_PLACEHOLDER:
-                keyring.set_password(
-                    f'{slugify(row["name"])}@finch',
-                    row["access_key"],
-                    row["secret_key"],
-                )
+            secret = row.get("secret_key")
+            key = (_keyring_service(row["name"]), row["access_key"])
+            if secret and self._secret_cache.get(key) != secret:
+                writes.append((key, secret))
             to_save.append({k: v for k, v in row.items() if k != "secret_key"})
 
-        CredentialsManager().save_credentials(to_save)
-
-        for cred in self._deleted:
-            service = f'{slugify(cred["name"])}@finch'
-            if keyring.get_password(service, cred["access_key"]) is not None:
+        # The service remembers secrets it read; they may be about to change.
+        s3_service.forget_secrets()
+        with ThreadPoolExecutor(max_workers=_KEYRING_WORKERS) as pool:
+            futures = [pool.submit(keyring.set_password, *key, secret) for key, secret in writes]
+            for (key, secret), future in zip(writes, futures):
+                future.result()
+                self._secret_cache[key] = secret
+
+            CredentialsManager().save_credentials(to_save)
+
+            # A removed credential may have been re-added under the same name;
+            # its keyring entry now belongs to the surviving row.
+            kept = {(_keyring_service(row["name"]), row["access_key"]) for row in self._rows}
+            doomed = {(_keyring_service(cred["name"]), cred["access_key"]) for cred in self._deleted}
+            futures = [pool.submit(_delete_secret, *key) for key in doomed - kept]
+            for future in futures:
                 try:
-                    keyring.delete_password(service, cred["access_key"])
+                    future.result()
                 except keyring.errors.PasswordDeleteError as e:
                     show_error_dialog(f"Keyring deletion error: {e}", show_traceback=True)
-        self._deleted.clear()
\ No newline at end of file
+        self._deleted.clear()
@@ -1,10 +1,17 @@
-from PySide6.QtCore import QAbstractTableModel, Qt
-from PySide6.QtWidgets import QApplication, QItemDelegate, QStyle, QStyledItemDelegate
-from slugify import slugify
+from typing import Optional
 
-from finch.settings.credentials.manager import COLUMNS, CredentialsDraft
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import QApplication, QItemDelegate, QLineEdit, QStyle, QStyledItemDelegate
+
+from finch.settings.credentials.manager import COLUMN_KEYS, COLUMNS, CredentialsDraft
 from finch.utils.error import show_error_dialog
 
+_COLUMN_COUNT = len(COLUMNS)
+_NAME_COL = COLUMN_KEYS.index("name")
+_SECRET_COL = COLUMN_KEYS.index("secret_key")
+# Shown for stored secrets so the table never has to read the keyring to paint.
+_SECRET_MASK = "******"
+
 
 class CredentialsModel(QAbstractTableModel):
     def __init__(self, draft: CredentialsDraft, parent=None):
@@ -15,19 +22,25 @@ class CredentialsModel(QAbstractTableModel):
         return self._draft.row_count()
 
     def columnCount(self, parent=None) -> int:
-        return len(COLUMNS)
+        return _COLUMN_COUNT
 
     def flags(self, index):
         base = Qt.ItemIsEnabled | Qt.ItemIsSelectable
         # Credential name is locked once set; all other fields are always editable.
-        if index.column() != 0 or not index.data():
+        col = index.column()
+        if col != _NAME_COL or not self._draft.get_value(index.row(), col):
             return base | Qt.ItemIsEditable
         return base
 
     def data(self, index, role=Qt.DisplayRole):
-        if index.isValid() and role == Qt.DisplayRole:
-            return self._draft.get_value(index.row(), index.column())
-        return None
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        row, col = index.row(), index.column()
+        if col != _SECRET_COL:
+            return self._draft.get_value(row, col)
+        if role == Qt.DisplayRole:
+            return _SECRET_MASK if self._draft.has_secret(row) else ""
+        return self._draft.get_secret(row)
 
     def headerData(self, section, orientation, role):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
@@ -35,28 +48,31 @@ class CredentialsModel(QAbstractTableModel):
         return None
 
     def setData(self, index, value, role=Qt.EditRole):
-        if value and index.column() == 0 and self._has_duplicate(value):
+        if value and index.column() == _NAME_COL and self._draft.has_duplicate_name(index.row(), value):
             show_error_dialog("A credential with this name already exists")
         elif value:
             self._draft.set_value(index.row(), index.column(), value)
             self.dataChanged.emit(index, index, (Qt.DisplayRole,))
         return True
 
+    def insert_rows(self, rows: list) -> None:
+        """Append rows to the draft with a single row-insertion notification."""
+        if not rows:
+            return
+        start = self._draft.row_count()
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._draft.insert_rows(rows)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> None:
+        """Remove row from the draft with a single row-removal notification."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._draft.delete_row(row)
+        self.endRemoveRows()
+
     def validate(self) -> None:
         """Raise ValueError if any required field is blank."""
-        for i in range(self.rowCount()):
-            for col, (key, display) in enumerate(COLUMNS):
-                if key == "secret_key":
-                    continue  # placeholder is acceptable
-                if not (self._draft.get_value(i, col) or "").strip():
-                    raise ValueError(f"'{display}' cannot be empty (row {i + 1})")
-
-    def _has_duplicate(self, value: str) -> bool:
-        slug = slugify(value)
-        return any(
-            slugify(self.index(i, 0).data() or "") == slug
-            for i in range(self.rowCount())
-        )
+        self._draft.validate()
 
 
 class TextEditorDelegate(QItemDelegate):
@@ -68,11 +84,23 @@ class TextEditorDelegate(QItemDelegate):
 
 
 class PasswordDelegate(QStyledItemDelegate):
-    """Renders cell content as password bullets."""
+    """Renders cell content as password bullets and edits it masked."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # The style's password character doesn't change between paints; look it up once.
+        self._mask: Optional[str] = None
+
+    def createEditor(self, parent, option, index):
+        editor = super().createEditor(parent, option, index)
+        if isinstance(editor, QLineEdit):
+            editor.setEchoMode(QLineEdit.Password)
+        return editor
 
     def initStyleOption(self, option, index):
         super().initStyleOption(option, index)
-        style = option.widget.style() or QApplication.style()
-        hint = style.styleHint(QStyle.SH_LineEdit_PasswordCharacter)
         if index.data():
-            option.text = chr(hint) * 6
\ No newline at end of file
+            if self._mask is None:
+                style = option.widget.style() if option.widget else QApplication.style()
+                self._mask = chr(style.styleHint(QStyle.SH_LineEdit_PasswordCharacter)) * 6
+            option.text = self._mask
\ No newline at end of file
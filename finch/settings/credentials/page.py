@@ -1,5 +1,5 @@
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QWidget, QBoxLayout, QTableView, QToolBar,
     QAbstractItemView, QHeaderView,
@@ -7,7 +7,11 @@ from PySide6.QtWidgets import (
 
 from finch.settings.credentials.manager import CredentialsDraft
 from finch.settings.credentials.model import CredentialsModel, TextEditorDelegate, PasswordDelegate
-from finch.utils.ui import resource_path
+from finch.utils.ui import load_icon
+
+# Pixel widths for the endpoint, access key, secret key and region columns;
+# the name column stretches to fill the rest.
+_COLUMN_WIDTHS = (200, 160, 100, 100)
 
 
 class CredentialsPage(QWidget):
@@ -25,25 +29,29 @@ class CredentialsPage(QWidget):
 
         add_action = QAction(self)
         add_action.setText("&Add Credential")
-        add_action.setIcon(QIcon(resource_path('img/new-credential.svg')))
+        add_action.setIcon(load_icon('img/new-credential.svg'))
         add_action.triggered.connect(self._add_row)
         toolbar.addAction(add_action)
 
         self._delete_action = QAction(self)
         self._delete_action.setText("&Delete Credential")
-        self._delete_action.setIcon(QIcon(resource_path('img/trash.svg')))
+        self._delete_action.setIcon(load_icon('img/trash.svg'))
         self._delete_action.triggered.connect(self._delete_row)
 
         self.table = QTableView()
         self.table.setModel(CredentialsModel(self._draft))
         self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
-        self.table.model().layoutChanged.connect(self._on_layout_changed)
+        self.table.model().rowsRemoved.connect(self._on_rows_removed)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Fixed widths: ResizeToContents re-measures every row on each edit.
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setStretchLastSection(False)
         header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column, width in enumerate(_COLUMN_WIDTHS, start=1):
+            header.resizeSection(column, width)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.table.setItemDelegate(TextEditorDelegate(self.table))
         self.table.setItemDelegateForColumn(3, PasswordDelegate())
 
@@ -52,24 +60,21 @@ class CredentialsPage(QWidget):
         self._toolbar = toolbar
 
     def _add_row(self):
-        self._draft.insert_row()
         model = self.table.model()
-        model.insertRow(model.rowCount())
-        model.layoutChanged.emit()
+        model.insert_rows([{}])
         self.table.selectRow(model.rowCount() - 1)
         self._toolbar.addAction(self._delete_action)
 
     def _delete_row(self):
         indexes = self.table.selectedIndexes()
         if indexes:
-            self._draft.delete_row(indexes[0].row())
-            self.table.model().layoutChanged.emit()
+            self.table.model().remove_row(indexes[0].row())
             self._toolbar.removeAction(self._delete_action)
 
     def _on_selection_changed(self, selected, deselected):
         self._toolbar.addAction(self._delete_action)
 
-    def _on_layout_changed(self):
+    def _on_rows_removed(self):
         if self.table.model().rowCount() == 0:
             self._toolbar.removeAction(self._delete_action)
 
@@ -1,7 +1,8 @@
-from PySide6.QtCore import Qt, QSize, Signal
-from PySide6.QtGui import QFont, QIcon
+from typing import Dict
+
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
-    QDialog, QHBoxLayout, QVBoxLayout, QListWidget, QListWidgetItem,
+    QDialog, QHBoxLayout, QVBoxLayout, QListWidget,
     QStackedWidget, QWidget, QLabel, QDialogButtonBox,
 )
 
@@ -9,7 +10,7 @@ from finch.settings.credentials import CredentialsPage
 from finch.settings.log_settings import LoggingPage
 from finch.settings.ui_settings import UISettingsPage
 from finch.utils.error import show_error_dialog
-from finch.utils.ui import center_window, resource_path
+from finch.utils.ui import center_window, load_font, load_pixmap
 
 
 class AboutPage(QWidget):
@@ -19,15 +20,14 @@ class AboutPage(QWidget):
         layout.setAlignment(Qt.AlignTop)
 
         icon_label = QLabel()
-        icon_label.setPixmap(QIcon(resource_path("img/icon.png")).pixmap(QSize(80, 80)))
+        icon_label.setPixmap(load_pixmap("img/icon.png", 80))
         icon_label.setAlignment(Qt.AlignCenter)
 
         title_label = QLabel("Finch S3 Client")
-        title_label.setFont(QFont("sans", 24))
+        title_label.setFont(load_font("sans", 24))
         title_label.setAlignment(Qt.AlignCenter)
 
-        italic = QFont("sans", 11)
-        italic.setItalic(True)
+        italic = load_font("sans", 11, italic=True)
 
         subtitle_label = QLabel(
             'In memoriam of '
@@ -55,6 +55,10 @@ class AboutPage(QWidget):
             layout.addWidget(QLabel(name))
 
 
+# Page widget per navigation row, in SettingsDialog.PAGE_* order.
+_PAGE_CLASSES = (CredentialsPage, UISettingsPage, LoggingPage, AboutPage)
+
+
 class SettingsDialog(QDialog):
     settings_changed = Signal()
 
@@ -73,20 +77,18 @@ class SettingsDialog(QDialog):
         self._nav.setObjectName("settings-nav")
         self._nav.setFixedWidth(150)
         self._nav.setSpacing(2)
-        for label in ("Credentials", "UI Settings", "Logging", "About"):
-            item = QListWidgetItem(label)
-            item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            self._nav.addItem(item)
+        self._nav.setUniformItemSizes(True)
+        # List views already left-align and vertically centre item text.
+        self._nav.addItems(("Credentials", "UI Settings", "Logging", "About"))
 
+        # Pages are built the first time they are shown; until then an empty
+        # placeholder holds their slot in the stack.
         self._pages = QStackedWidget()
-        self.creds_page   = CredentialsPage()
-        self.ui_page      = UISettingsPage()
-        self.logging_page = LoggingPage()
-        self.about_page   = AboutPage()
-        for page in (self.creds_page, self.ui_page, self.logging_page, self.about_page):
-            self._pages.addWidget(page)
+        self._built: Dict[int, QWidget] = {}
+        for _ in _PAGE_CLASSES:
+            self._pages.addWidget(QWidget())
 
-        self._nav.currentRowChanged.connect(self._pages.setCurrentIndex)
+        self._nav.currentRowChanged.connect(self._show_page)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self._save)
@@ -102,11 +104,21 @@ class SettingsDialog(QDialog):
 
         self._nav.setCurrentRow(start_page)
 
+    def _show_page(self, row: int) -> None:
+        if row not in self._built:
+            page = self._built[row] = _PAGE_CLASSES[row]()
+            placeholder = self._pages.widget(row)
+            self._pages.insertWidget(row, page)
+            self._pages.removeWidget(placeholder)
+            placeholder.deleteLater()
+        self._pages.setCurrentIndex(row)
+
     def _save(self):
         try:
-            self.creds_page.save()
-            self.ui_page.save()
-            self.logging_page.save()
+            # A page that was never opened has nothing to save.
+            for row in sorted(self._built):
+                if row != self.PAGE_ABOUT:
+                    self._built[row].save()
             self.settings_changed.emit()
             self.accept()
         except ValueError as e:
@@ -46,6 +46,16 @@ class UISettingsPage(QWidget):
         hint2.setWordWrap(True)
         layout.addWidget(hint2)
 
+        self.compact_chains = QCheckBox("Compact single-child folder chains")
+        self.compact_chains.setChecked(app_settings.compact_single_child_chains)
+        layout.addWidget(self.compact_chains)
+
+        hint3 = QLabel("Shows a folder whose only content is another folder as one row, e.g. \"a/b/c\".")
+        hint3.setObjectName("hint")
+        hint3.setContentsMargins(20, 0, 0, 0)
+        hint3.setWordWrap(True)
+        layout.addWidget(hint3)
+
         self._section(layout, "Date / Time")
 
         current = app_settings.datetime_format
@@ -82,6 +92,7 @@ class UISettingsPage(QWidget):
     def save(self):
         app_settings.check_folder_contents = self.check_folder_contents.isChecked()
         app_settings.native_file_icons = self.native_file_icons.isChecked()
+        app_settings.compact_single_child_chains = self.compact_chains.isChecked()
         fmt = self.dt_combo.currentData()
         app_settings.datetime_format = (self.custom_dt.text() or app_settings.datetime_format) if fmt is None else fmt
         app_settings.save()
\ No newline at end of file
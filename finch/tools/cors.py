@@ -2,7 +2,6 @@ import asyncio
 
 from PySide6.QtCore import Qt
 from finch.utils import async_slot
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                QMessageBox, QGroupBox, QFormLayout, QLineEdit,
                                QListWidget, QListWidgetItem, QCheckBox, QTextEdit,
@@ -10,7 +9,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
 from botocore.exceptions import ClientError
 
 from finch.s3 import s3_service
-from finch.utils.ui import center_window, resource_path
+from finch.utils.ui import center_window, load_icon
 from finch.utils.text import format_datetime, format_size, format_list_with_conjunction
 from finch.utils.error import show_error_dialog
 
@@ -87,12 +86,12 @@ class CORSWindow(QWidget):
         buttons_widget.setLayout(buttons_layout)
 
         self.save_rule_button = QPushButton("Save Changes")
-        self.save_rule_button.setIcon(QIcon(resource_path("img/save.svg")))
+        self.save_rule_button.setIcon(load_icon("img/save.svg"))
         self.save_rule_button.clicked.connect(self.save_rule)
         self.save_rule_button.setEnabled(False)
         
         self.delete_rule_button = QPushButton("Delete Rule")
-        self.delete_rule_button.setIcon(QIcon(resource_path("img/trash.svg")))
+        self.delete_rule_button.setIcon(load_icon("img/trash.svg"))
         self.delete_rule_button.clicked.connect(self.delete_rule)
         self.delete_rule_button.setEnabled(False)
 
@@ -106,11 +105,11 @@ class CORSWindow(QWidget):
         # Bottom buttons
         button_layout = QHBoxLayout()
         self.add_rule_button = QPushButton("Add New Rule")
-        self.add_rule_button.setIcon(QIcon(resource_path("img/plus.svg")))
+        self.add_rule_button.setIcon(load_icon("img/plus.svg"))
         self.add_rule_button.clicked.connect(self.add_new_rule)
         
         self.apply_button = QPushButton("Apply CORS Rules")
-        self.apply_button.setIcon(QIcon(resource_path("img/save.svg")))
+        self.apply_button.setIcon(load_icon("img/save.svg"))
         self.apply_button.clicked.connect(self.apply_cors)
 
         button_layout.addWidget(self.add_rule_button)
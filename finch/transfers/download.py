@@ -4,7 +4,7 @@ import time
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Slot, Qt
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QProgressBar,
                                QLabel, QPushButton, QScrollArea, QWidget)
 
@@ -14,7 +14,7 @@ from finch.utils.ui import center_window
 from finch.utils.error import show_error_dialog
 
 
-@dataclass
+@dataclass(slots=True)
 class S3DownloadItem:
     bucket_name: str
     key: str
@@ -27,6 +27,7 @@ class S3DownloadItem:
     last_update_time: float = 0.0
     last_downloaded: int = 0
     speed: float = 0.0
+    last_percent: int = -1
 
     def __post_init__(self):
         self.filename = os.path.basename(self.key)
@@ -107,11 +108,6 @@ class MultiDownloadProgressDialog(QDialog):
                 destination=local_file_path,
                 filename=os.path.basename(key),
             )
-            try:
-                item.total_size = s3_service.get_object_size(bucket_name, key)
-            except Exception as e:
-                self._failed_signal.emit(item.filename, str(e))
-                continue
             self._items.append(item)
             widget = DownloadProgressWidget(item.filename, f"{bucket_name}/{key}")
             self._progress_widgets[item.filename] = widget
@@ -148,9 +144,15 @@ class MultiDownloadProgressDialog(QDialog):
                 item.last_update_time = now
             if item.total_size:
                 percent = int((item.downloaded / item.total_size) * 100)
-                self._progress_signal.emit(item.filename, percent, item.speed)
+                # boto3 reports every chunk; only cross to the GUI thread when the bar moves.
+                if percent != item.last_percent:
+                    item.last_percent = percent
+                    self._progress_signal.emit(item.filename, percent, item.speed)
 
         try:
+            # Sized here, not while building the dialog: one HEAD per file on
+            # the GUI thread would freeze it for the whole selection.
+            item.total_size = s3_service.get_object_size(item.bucket_name, item.key)
             with open(temp_path, 'wb') as f:
                 s3_service.download_fileobj(item.bucket_name, item.key, f,
                                             callback=progress_cb)
@@ -165,10 +167,12 @@ class MultiDownloadProgressDialog(QDialog):
                 pass
             self._failed_signal.emit(item.filename, str(e))
 
+    @Slot(str, int, float)
     def _update_progress(self, filename: str, percent: int, speed: float):
         if filename in self._progress_widgets:
             self._progress_widgets[filename].update_progress(percent, speed)
 
+    @Slot(str)
     def _handle_completion(self, filename: str):
         self._done += 1
         if filename in self._progress_widgets:
@@ -181,6 +185,7 @@ class MultiDownloadProgressDialog(QDialog):
                 f"Downloading files... ({self._done}/{self._total} completed)"
             )
 
+    @Slot(str, str)
     def _handle_failure(self, filename: str, error: str):
         if filename in self._progress_widgets:
             self._progress_widgets[filename].mark_done(
@@ -3,10 +3,11 @@ import logging
 import os
 import time
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, Slot
 from PySide6.QtWidgets import QProgressDialog
 
 from finch.s3 import s3_service
+from finch.utils.error import show_error_dialog
 from finch.utils.text import format_size
 
 log = logging.getLogger(__name__)
@@ -27,6 +28,7 @@ class UploadDialog(QProgressDialog):
         self._on_success = on_success
         self._uploaded_size = 0
         self._start_time = None
+        self._last_percent = -1
 
         self.upload_succeeded = False
 
@@ -61,12 +63,17 @@ class UploadDialog(QProgressDialog):
             self._start_time = time.monotonic()
         self._uploaded_size += bytes_amount
         percent = int((self._uploaded_size / total_size) * 100)
+        # boto3 reports every chunk; only cross to the GUI thread when the bar moves.
+        if percent == self._last_percent:
+            return
+        self._last_percent = percent
         elapsed = time.monotonic() - self._start_time
         speed = self._uploaded_size / elapsed if elapsed > 0 else 0
         speed_str = f"{format_size(speed)}/s" if speed > 0 else "…"
         self._label_signal.emit(f"Uploading {self._file_name}… {speed_str}")
         self._progress_signal.emit(percent)
 
+    @Slot()
     def _on_completed(self):
         log.debug("_on_completed: upload done, invoking on_success callback then accept()")
         self.upload_succeeded = True
@@ -74,8 +81,8 @@ class UploadDialog(QProgressDialog):
             self._on_success()
         self.accept()
 
+    @Slot(str)
     def _on_failed(self, message: str):
         log.debug("_on_failed: %s", message)
-        from finch.utils.error import show_error_dialog
         show_error_dialog(message)
         self.reject()
@@ -1,31 +1,60 @@
-from datetime import datetime
-from typing import Union
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Union
 
 from finch.config import app_settings
 
 
 def key_display_name(key: str) -> str:
     """Return the last path segment of an S3 key for display."""
-    parts = [p for p in key.split('/') if p]
-    return parts[-1] if parts else ''
+    name = key.rpartition('/')[2]
+    if name:
+        return name
+    # Folder keys end in '/'; only they pay for the strip.
+    return key.rstrip('/').rpartition('/')[2]
+
+
+# strftime directives that show seconds or finer; formats without them can
+# share one rendered string per minute.
+_SUB_MINUTE_DIRECTIVES = ('%S', '%f', '%T', '%X', '%c', '%r', '%s')
+
+
+@lru_cache(maxsize=16)
+def _minute_precision(fmt: str) -> bool:
+    return not any(d in fmt for d in _SUB_MINUTE_DIRECTIVES)
+
+
+@lru_cache(maxsize=4096)
+def _format_minute(fmt: str, year: int, month: int, day: int, hour: int, minute: int,
+                   offset: Optional[timedelta], tzname: Optional[str]) -> str:
+    tz = None if offset is None else timezone(offset, tzname) if tzname else timezone(offset)
+    return datetime(year, month, day, hour, minute, tzinfo=tz).strftime(fmt)
 
 
 def format_datetime(dt: datetime) -> str:
-    if dt:
-        return dt.strftime(app_settings.datetime_format)
-    return ''
+    if not dt:
+        return ''
+    fmt = app_settings.datetime_format
+    if not _minute_precision(fmt):
+        return dt.strftime(fmt)
+    # Objects uploaded together share a minute; strftime runs once for all of them.
+    # Key on the zone's offset and name: botocore's dateutil tzinfo objects are unhashable.
+    return _format_minute(fmt, dt.year, dt.month, dt.day, dt.hour, dt.minute,
+                          dt.utcoffset(), dt.tzname())
 
 
 def _remove_trailing_zeros(x: str) -> str:
     return x.rstrip('0').rstrip('.')
 
 
+_SIZE_UNITS = ('Bytes', 'Kilobytes', 'Megabytes', 'Gigabytes')
+
+
 def format_size(file_size: Union[int, float], decimal_places=2) -> str:
-    for unit in ['Bytes', 'Kilobytes', 'Megabytes', 'Gigabytes']:
-        if file_size < 1024.0 or unit == 'Gigabytes':
-            break
-        file_size /= 1024.0
-    return f'{_remove_trailing_zeros(f"{file_size:.{decimal_places}f}"): >8} {unit}'
+    # Each unit is 10 more bits, so the bit length picks it without a divide loop.
+    idx = min(len(_SIZE_UNITS) - 1, max(0, (int(file_size).bit_length() - 1) // 10))
+    value = file_size / (1 << (10 * idx))
+    return f'{_remove_trailing_zeros(f"{value:.{decimal_places}f}"): >8} {_SIZE_UNITS[idx]}'
 
 
 def format_list_with_conjunction(items: list, conjunction='and') -> str:
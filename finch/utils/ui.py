@@ -1,34 +1,43 @@
 import os
 import pathlib
 import sys
+from functools import lru_cache
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPalette, QColor
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QColor, QFont, QIcon, QPalette, QPixmap
 from PySide6.QtWidgets import QApplication
 
 
+@lru_cache(maxsize=None)
+def _dark_palette() -> QPalette:
+    """Build the dark palette once; re-theming reuses it."""
+    dark, darker, darkest = QColor(53, 53, 53), QColor(35, 35, 35), QColor(25, 25, 25)
+    accent = QColor(42, 130, 218)
+    palette = QPalette()
+    palette.setColor(QPalette.Window, dark)
+    palette.setColor(QPalette.WindowText, Qt.white)
+    palette.setColor(QPalette.Base, darker)
+    palette.setColor(QPalette.AlternateBase, dark)
+    palette.setColor(QPalette.ToolTipBase, darkest)
+    palette.setColor(QPalette.ToolTipText, Qt.white)
+    palette.setColor(QPalette.Text, Qt.white)
+    palette.setColor(QPalette.Button, dark)
+    palette.setColor(QPalette.ButtonText, Qt.white)
+    palette.setColor(QPalette.BrightText, Qt.red)
+    palette.setColor(QPalette.Link, accent)
+    palette.setColor(QPalette.Highlight, accent)
+    palette.setColor(QPalette.HighlightedText, Qt.white)
+    palette.setColor(QPalette.Active, QPalette.Button, dark)
+    palette.setColor(QPalette.Disabled, QPalette.ButtonText, Qt.darkGray)
+    palette.setColor(QPalette.Disabled, QPalette.WindowText, Qt.darkGray)
+    palette.setColor(QPalette.Disabled, QPalette.Text, Qt.darkGray)
+    palette.setColor(QPalette.Disabled, QPalette.Light, dark)
+    return palette
+
+
 def apply_theme(app):
     if sys.platform != "win32":
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        palette.setColor(QPalette.WindowText, Qt.white)
-        palette.setColor(QPalette.Base, QColor(35, 35, 35))
-        palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        palette.setColor(QPalette.ToolTipBase, QColor(25, 25, 25))
-        palette.setColor(QPalette.ToolTipText, Qt.white)
-        palette.setColor(QPalette.Text, Qt.white)
-        palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ButtonText, Qt.white)
-        palette.setColor(QPalette.BrightText, Qt.red)
-        palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.HighlightedText, Qt.white)
-        palette.setColor(QPalette.Active, QPalette.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.Disabled, QPalette.ButtonText, Qt.darkGray)
-        palette.setColor(QPalette.Disabled, QPalette.WindowText, Qt.darkGray)
-        palette.setColor(QPalette.Disabled, QPalette.Text, Qt.darkGray)
-        palette.setColor(QPalette.Disabled, QPalette.Light, QColor(53, 53, 53))
-        app.setPalette(palette)
+        app.setPalette(_dark_palette())
 
     qss_path = resource_path("img/theme.qss")
     try:
@@ -43,6 +52,26 @@ def apply_theme(app):
         pass
 
 
+@lru_cache(maxsize=None)
+def load_icon(relative_path: str) -> QIcon:
+    """Return the bundled icon at relative_path, loading each file only once."""
+    return QIcon(resource_path(relative_path))
+
+
+@lru_cache(maxsize=None)
+def load_pixmap(relative_path: str, size: int) -> QPixmap:
+    """Return the bundled icon rasterized at size x size, rendering it only once."""
+    return load_icon(relative_path).pixmap(QSize(size, size))
+
+
+@lru_cache(maxsize=None)
+def load_font(family: str, point_size: int, italic: bool = False) -> QFont:
+    """Return a shared QFont; widgets copy it on setFont, so callers must not mutate it."""
+    font = QFont(family, point_size)
+    font.setItalic(italic)
+    return font
+
+
 def center_window(window):
     geometry = window.frameGeometry()
     center_point = QApplication.primaryScreen().availableGeometry().center()
@@ -1,6 +1,8 @@
 import json
 from unittest.mock import mock_open, patch
 
+import pytest
+
 from finch.config import ObjectType, Settings
 
 
@@ -18,6 +20,7 @@ class TestSettingsDefaults:
     def test_defaults(self):
         s = Settings()
         assert s.check_folder_contents is True
+        assert s.compact_single_child_chains is False
         assert s.datetime_format == "%d %b %Y %H:%M"
         assert s.logging_enabled is False
         assert s.logging_to_file is False
@@ -28,6 +31,7 @@ class TestSettingsLoad:
     def test_load_updates_fields(self):
         data = {
             "check_folder_contents": False,
+            "compact_single_child_chains": True,
             "datetime_format": "%Y/%m/%d",
             "logging_enabled": True,
             "logging_to_file": False,
@@ -38,6 +42,7 @@ class TestSettingsLoad:
         with patch("builtins.open", mock_open(read_data=json.dumps(data))):
             s.load()
         assert s.check_folder_contents is False
+        assert s.compact_single_child_chains is True
         assert s.datetime_format == "%Y/%m/%d"
         assert s.logging_enabled is True
         assert s.log_file_path == "/tmp/finch.log"
@@ -57,14 +62,23 @@ class TestSettingsLoad:
 
 
 class TestSettingsSave:
-    def test_save_writes_json(self):
+    def test_save_writes_json(self, tmp_path):
         s = Settings()
-        m = mock_open()
-        with patch("builtins.open", m):
-            with patch("json.dump") as mock_dump:
-                s.save()
-        mock_dump.assert_called_once()
-        saved = mock_dump.call_args[0][0]
+        path = tmp_path / "settings.json"
+        with patch("finch.config.SETTINGS_FILE", str(path)):
+            s.save()
+        saved = json.loads(path.read_text())
         assert saved["check_folder_contents"] == s.check_folder_contents
         assert saved["datetime_format"] == s.datetime_format
         assert "logger_levels" in saved
+
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        s = Settings()
+        path = tmp_path / "settings.json"
+        path.write_text('{"datetime_format": "%Y"}')
+        s.logger_levels["bad"] = object()   # not JSON serializable
+        with patch("finch.config.SETTINGS_FILE", str(path)):
+            with pytest.raises(TypeError):
+                s.save()
+        assert json.loads(path.read_text()) == {"datetime_format": "%Y"}
+        assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
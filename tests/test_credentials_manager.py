@@ -15,6 +15,13 @@ SAMPLE_CREDS = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def _clear_credentials_cache():
+    CredentialsManager.clear_cache()
+    yield
+    CredentialsManager.clear_cache()
+
+
 def make_manager(creds=None):
     data = creds if creds is not None else SAMPLE_CREDS
     m = mock_open(read_data=json.dumps(data))
@@ -39,18 +46,43 @@ class TestCredentialsManager:
         mgr = make_manager()
         assert mgr.get_credential("missing") == {}
 
+    def test_get_credential_prefers_first_duplicate(self):
+        mgr = make_manager(SAMPLE_CREDS + [{**SAMPLE_CREDS[0], "access_key": "AKIA3"}])
+        assert mgr.get_credential("prod")["access_key"] == "AKIA1"
+
+    def test_empty_file_skips_parse(self):
+        with patch("builtins.open", mock_open(read_data="")), patch("json.loads") as mock_loads:
+            mgr = CredentialsManager()
+        assert mgr.get_credentials() == []
+        mock_loads.assert_not_called()
+
     def test_get_credentials_bad_json(self):
         with patch("builtins.open", mock_open(read_data="!!invalid!!")):
             mgr = CredentialsManager()
         assert mgr.get_credentials() == []
 
-    def test_save_credentials(self):
+    def test_save_credentials(self, tmp_path):
         mgr = make_manager()
-        m = mock_open()
-        with patch("builtins.open", m):
-            with patch("json.dump") as mock_dump:
-                mgr.save_credentials(SAMPLE_CREDS)
-        mock_dump.assert_called_once_with(SAMPLE_CREDS, m())
+        with patch("finch.settings.credentials.manager.CONFIG_PATH", str(tmp_path)):
+            mgr.save_credentials(SAMPLE_CREDS)
+        assert json.loads((tmp_path / "credentials.json").read_text()) == SAMPLE_CREDS
+        assert [p.name for p in tmp_path.iterdir()] == ["credentials.json"]
+
+
+    def test_reuses_parse_while_mtime_unchanged(self, tmp_path):
+        (tmp_path / "credentials.json").write_text(json.dumps(SAMPLE_CREDS))
+        with patch("finch.settings.credentials.manager.CONFIG_PATH", str(tmp_path)):
+            assert CredentialsManager().get_credentials() == SAMPLE_CREDS
+            with patch("json.loads") as mock_loads:
+                assert CredentialsManager().get_credentials() == SAMPLE_CREDS
+            mock_loads.assert_not_called()
+
+    def test_save_invalidates_cache(self, tmp_path):
+        (tmp_path / "credentials.json").write_text(json.dumps(SAMPLE_CREDS))
+        with patch("finch.settings.credentials.manager.CONFIG_PATH", str(tmp_path)):
+            mgr = CredentialsManager()
+            mgr.save_credentials(SAMPLE_CREDS[:1])
+            assert CredentialsManager().get_credentials() == SAMPLE_CREDS[:1]
 
 
 class TestCredentialsDraft:
@@ -92,7 +124,113 @@ class TestCredentialsDraft:
         draft.delete_row(0)
         assert draft.row_count() == len(SAMPLE_CREDS) - 1
 
-    def test_secret_key_masked(self):
+    def test_secret_not_loaded_eagerly(self):
+        with patch("keyring.get_password") as mock_get:
+            draft = self._make_draft()
+            assert draft.has_secret(0)
+        mock_get.assert_not_called()
+
+    def test_get_secret_reads_keyring_once(self):
+        draft = self._make_draft()
+        with patch("keyring.get_password", return_value="s3cr3t") as mock_get:
+            assert draft.get_secret(0) == "s3cr3t"
+            assert draft.get_secret(0) == "s3cr3t"
+        mock_get.assert_called_once_with("prod@finch", "AKIA1")
+
+    def test_persist_skips_unchanged_secrets(self):
+        draft = self._make_draft()
+        secret_col = next(i for i, (k, _) in enumerate(COLUMNS) if k == "secret_key")
+        with patch("keyring.get_password", return_value="s3cr3t"):
+            draft.set_value(0, secret_col, draft.get_secret(0))
+        draft.set_value(1, secret_col, "changed")
+        with patch("keyring.set_password") as mock_set, \
+                patch("finch.settings.credentials.manager.CredentialsManager"):
+            draft.persist()
+        mock_set.assert_called_once_with("dev@finch", "AKIA2", "changed")
+
+    def test_has_duplicate_name_by_slug(self):
+        draft = self._make_draft()
+        draft.insert_row()
+        new_row = draft.row_count() - 1
+        assert draft.has_duplicate_name(new_row, "Prod")
+        assert not draft.has_duplicate_name(new_row, "staging")
+
+    def test_has_duplicate_name_ignores_own_row(self):
+        draft = self._make_draft()
+        assert not draft.has_duplicate_name(0, "prod")
+
+    def test_slug_index_follows_rename_and_delete(self):
+        draft = self._make_draft()
+        name_col = next(i for i, (k, _) in enumerate(COLUMNS) if k == "name")
+        draft.insert_row()
+        new_row = draft.row_count() - 1
+        draft.set_value(0, name_col, "renamed")
+        assert not draft.has_duplicate_name(new_row, "prod")
+        assert draft.has_duplicate_name(new_row, "renamed")
+        draft.delete_row(0)
+        assert not draft.has_duplicate_name(draft.row_count() - 1, "renamed")
+
+    def test_validate_accepts_stored_rows(self):
+        draft = self._make_draft()
+        draft.validate()
+
+    def test_validate_rejects_blank_field(self):
+        draft = self._make_draft()
+        draft.insert_row()
+        with pytest.raises(ValueError, match=r"'Credential Name' cannot be empty \(row 3\)"):
+            draft.validate()
+
+    def test_insert_rows_fills_defaults(self):
+        draft = self._make_draft([])
+        draft.insert_rows([{"name": "a"}, {"name": "b", "region": "eu-west-1"}])
+        assert draft.row_count() == 2
+        region_col = next(i for i, (k, _) in enumerate(COLUMNS) if k == "region")
+        assert draft.get_value(0, region_col) == "us-east-1"
+        assert draft.get_value(1, region_col) == "eu-west-1"
+        assert draft.has_duplicate_name(0, "b")
+
+    def test_inserted_rows_do_not_share_state(self):
+        draft = self._make_draft([])
+        draft.insert_row()
+        draft.insert_row()
+        name_col = next(i for i, (k, _) in enumerate(COLUMNS) if k == "name")
+        draft.set_value(0, name_col, "first")
+        assert draft.get_value(1, name_col) == ""
+
+    def test_persist_deletes_removed_secrets(self):
+        draft = self._make_draft()
+        draft.delete_row(1)
+        with patch("keyring.get_password", return_value="old"), \
+                patch("keyring.delete_password") as mock_delete, \
+                patch("finch.settings.credentials.manager.CredentialsManager"):
+            draft.persist()
+        mock_delete.assert_called_once_with("dev@finch", "AKIA2")
+
+    def test_persist_stops_before_saving_when_keyring_write_fails(self):
         draft = self._make_draft()
         secret_col = next(i for i, (k, _) in enumerate(COLUMNS) if k == "secret_key")
-        assert draft.get_value(0, secret_col) == "xxx"
+        draft.set_value(0, secret_col, "new")
+        with patch("keyring.set_password", side_effect=RuntimeError("locked")), \
+                patch("finch.settings.credentials.manager.CredentialsManager") as mock_mgr:
+            with pytest.raises(RuntimeError):
+                draft.persist()
+        mock_mgr.return_value.save_credentials.assert_not_called()
+
+    def test_persist_keeps_secret_of_readded_credential(self):
+        draft = self._make_draft()
+        draft.delete_row(1)
+        draft.insert_rows([{"name": "dev", "access_key": "AKIA2", "secret_key": "fresh"}])
+        with patch("keyring.set_password") as mock_set, \
+                patch("keyring.delete_password") as mock_delete, \
+                patch("finch.settings.credentials.manager.CredentialsManager"):
+            draft.persist()
+        mock_set.assert_called_once_with("dev@finch", "AKIA2", "fresh")
+        mock_delete.assert_not_called()
+
+    def test_persist_drops_service_secrets(self):
+        draft = self._make_draft()
+        with patch("keyring.set_password"), \
+                patch("finch.settings.credentials.manager.s3_service") as mock_service, \
+                patch("finch.settings.credentials.manager.CredentialsManager"):
+            draft.persist()
+        mock_service.forget_secrets.assert_called_once_with()
@@ -31,6 +31,18 @@ class TestUploadDialogProgress:
         upload_dialog._on_progress(1024, 1024)
         assert received == [100]
 
+    def test_unchanged_percent_is_not_emitted(self, upload_dialog):
+        upload_dialog._start_time = time.monotonic() - 1.0
+        upload_dialog._uploaded_size = 0
+        received, labels = [], []
+        upload_dialog._progress_signal.connect(received.append)
+        upload_dialog._label_signal.connect(labels.append)
+        for _ in range(4):
+            upload_dialog._on_progress(1, 1000)
+        upload_dialog._on_progress(10, 1000)
+        assert received == [0, 1]
+        assert len(labels) == 2
+
     def test_start_time_set_on_first_call(self, upload_dialog):
         upload_dialog._start_time = None
         upload_dialog._on_progress(100, 1000)
@@ -1,7 +1,11 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 from finch.config import ObjectType
 from finch.s3.service import S3Object, S3Service
@@ -59,11 +63,48 @@ class TestS3ServiceSetCredential:
             svc.set_credential({**SAMPLE_CRED, "endpoint": ""})
         assert svc._credentials["endpoint_url"] is None
 
+    def test_secret_read_once_per_credential(self):
+        svc = S3Service()
+        with patch("keyring.get_password", return_value="s") as mock_kr:
+            svc.set_credential(SAMPLE_CRED)
+            svc.set_credential({**SAMPLE_CRED, "name": "other"})
+            svc.set_credential(SAMPLE_CRED)
+        assert mock_kr.call_count == 2
+
+    def test_set_credential_uses_prefetched_secret(self):
+        svc = S3Service()
+        with patch("keyring.get_password", return_value="s") as mock_kr:
+            assert svc.read_secret(SAMPLE_CRED) == "s"
+            svc.set_credential(SAMPLE_CRED)
+        mock_kr.assert_called_once_with("test@finch", "AKIA1")
+
+    def test_forget_secrets_rereads_keyring(self):
+        svc = S3Service()
+        with patch("keyring.get_password", return_value="old"):
+            svc.set_credential(SAMPLE_CRED)
+        svc.forget_secrets()
+        with patch("keyring.get_password", return_value="new"):
+            svc.set_credential(SAMPLE_CRED)
+        assert svc._credentials["aws_secret_access_key"] == "new"
+
     def test_no_credentials_raises(self):
         svc = S3Service()
         with pytest.raises(RuntimeError, match="No credentials set"):
             _ = svc.client
 
+    def test_client_shared_across_threads_until_credentials_change(self):
+        svc = make_service()
+        with patch("boto3.client", side_effect=lambda *a, **kw: MagicMock()) as mock_factory:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                clients = list(pool.map(lambda _: svc.client, range(8)))
+            assert all(c is clients[0] for c in clients)
+            with patch("keyring.get_password", return_value="s"):
+                svc.set_credential(SAMPLE_CRED)
+            assert svc.client is not clients[0]
+        assert mock_factory.call_count == 2
+        assert mock_factory.call_args.kwargs["config"].max_pool_connections >= 16
+        assert mock_factory.call_args.kwargs["config"].retries == {"mode": "standard"}
+
 
 class TestS3ServiceListBuckets:
     def test_returns_s3_objects(self):
@@ -76,7 +117,6 @@ class TestS3ServiceListBuckets:
             ]
         }
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             buckets = svc.list_buckets()
         assert len(buckets) == 2
         assert buckets[0].name == "bucket-a"
@@ -88,7 +128,6 @@ class TestS3ServiceListBuckets:
         mock_client = MagicMock()
         mock_client.list_buckets.return_value = {"Buckets": []}
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             assert svc.list_buckets() == []
 
 
@@ -96,14 +135,13 @@ class TestS3ServiceListObjects:
     def test_parses_folders_and_files(self):
         svc = make_service()
         mock_client = MagicMock()
-        mock_client.list_objects.return_value = {
+        mock_client.list_objects_v2.return_value = {
             "CommonPrefixes": [{"Prefix": "folder/"}],
             "Contents": [
                 {"Key": "file.txt", "Size": 1024, "LastModified": datetime(2024, 1, 1)},
             ],
         }
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             results = svc.list_objects("my-bucket", "")
         assert len(results) == 2
         folders = [r for r in results if r.type == ObjectType.FOLDER]
@@ -116,7 +154,7 @@ class TestS3ServiceListObjects:
     def test_skips_folder_marker(self):
         svc = make_service()
         mock_client = MagicMock()
-        mock_client.list_objects.return_value = {
+        mock_client.list_objects_v2.return_value = {
             "CommonPrefixes": [],
             "Contents": [
                 {"Key": "prefix/", "Size": 0, "LastModified": datetime(2024, 1, 1)},
@@ -124,11 +162,21 @@ class TestS3ServiceListObjects:
             ],
         }
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             results = svc.list_objects("my-bucket", "prefix/")
         assert len(results) == 1
         assert results[0].key == "prefix/file.txt"
 
+    def test_passes_resume_parameters(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {}
+        with patch("boto3.client", return_value=mock_client):
+            svc.list_objects("my-bucket", "p/", continuation_token="tok", start_after="p/m")
+        mock_client.list_objects_v2.assert_called_once_with(
+            Bucket="my-bucket", Prefix="p/", Delimiter="/", MaxKeys=1000,
+            StartAfter="p/m", ContinuationToken="tok",
+        )
+
 
 class TestS3ServiceUpload:
     def test_upload_fileobj_calls_client(self):
@@ -136,7 +184,6 @@ class TestS3ServiceUpload:
         mock_client = MagicMock()
         fake_file = MagicMock()
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             svc.upload_fileobj(fake_file, "my-bucket", "folder/file.txt")
         mock_client.upload_fileobj.assert_called_once_with(
             fake_file, "my-bucket", "folder/file.txt", Callback=None
@@ -147,7 +194,6 @@ class TestS3ServiceUpload:
         mock_client = MagicMock()
         cb = MagicMock()
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             svc.upload_fileobj(MagicMock(), "b", "k", callback=cb)
         mock_client.upload_fileobj.assert_called_once()
         _, kwargs = mock_client.upload_fileobj.call_args
@@ -160,7 +206,6 @@ class TestS3ServiceDownload:
         mock_client = MagicMock()
         fake_file = MagicMock()
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             svc.download_fileobj("my-bucket", "folder/file.txt", fake_file)
         mock_client.download_fileobj.assert_called_once_with(
             "my-bucket", "folder/file.txt", fake_file, Callback=None
@@ -171,7 +216,6 @@ class TestS3ServiceDownload:
         mock_client = MagicMock()
         cb = MagicMock()
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             svc.download_fileobj("b", "k", MagicMock(), callback=cb)
         mock_client.download_fileobj.assert_called_once()
         _, kwargs = mock_client.download_fileobj.call_args
@@ -182,7 +226,6 @@ class TestS3ServiceDownload:
         mock_client = MagicMock()
         mock_client.head_object.return_value = {"ContentLength": 4096}
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             size = svc.get_object_size("my-bucket", "file.txt")
         assert size == 4096
 
@@ -193,7 +236,6 @@ class TestS3ServiceIsBucketEmpty:
         mock_client = MagicMock()
         mock_client.list_objects_v2.return_value = {"KeyCount": 0}
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             assert svc.is_bucket_empty("my-bucket") is True
 
     def test_non_empty_bucket(self):
@@ -201,5 +243,384 @@ class TestS3ServiceIsBucketEmpty:
         mock_client = MagicMock()
         mock_client.list_objects_v2.return_value = {"KeyCount": 1}
         with patch("boto3.client", return_value=mock_client):
-            svc._thread_local = __import__("threading").local()
             assert svc.is_bucket_empty("my-bucket") is False
+
+
+class TestS3ServiceIsFolderEmpty:
+    def _check(self, contents):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {"Contents": [{"Key": k} for k in contents]}
+        with patch("boto3.client", return_value=mock_client):
+            result = svc.is_folder_empty("my-bucket", "dir/")
+        mock_client.list_objects_v2.assert_called_once_with(
+            Bucket="my-bucket", Prefix="dir/", MaxKeys=2)
+        return result
+
+    def test_marker_only_is_empty(self):
+        assert self._check(["dir/"]) is True
+
+    def test_no_keys_is_empty(self):
+        assert self._check([]) is True
+
+    def test_nested_key_is_not_empty(self):
+        assert self._check(["dir/", "dir/sub/file"]) is False
+
+
+class TestS3ServiceProbeFolders:
+    def _probe(self, keys, truncated=False):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {
+            "Contents": [{"Key": k} for k in keys], "IsTruncated": truncated,
+        }
+        with patch("boto3.client", return_value=mock_client):
+            result = svc.probe_folders("my-bucket", "p/", ["p/a/", "p/b/", "p/c/"])
+        mock_client.list_objects_v2.assert_called_once_with(Bucket="my-bucket", Prefix="p/")
+        return result
+
+    def test_complete_listing_settles_every_folder(self):
+        result = self._probe(["p/a/", "p/a/x", "p/b/", "p/file"])
+        assert result == {"p/a/": False, "p/b/": True, "p/c/": True}
+
+    def test_truncated_listing_leaves_unreached_folders_out(self):
+        result = self._probe(["p/a/", "p/b/", "p/b/x"], truncated=True)
+        assert result == {"p/a/": True, "p/b/": False}
+
+    def test_truncated_inside_folder_marker_is_undecided(self):
+        result = self._probe(["p/a/", "p/b/"], truncated=True)
+        assert result == {"p/a/": True}
+
+
+class TestS3ServiceEmptinessCache:
+    def _service(self, mock_client):
+        mock_client.list_objects_v2.return_value = {"Contents": [{"Key": "p/a/"}]}
+        return make_service()
+
+    def test_repeat_probe_is_served_from_cache(self):
+        mock_client = MagicMock()
+        svc = self._service(mock_client)
+        with patch("boto3.client", return_value=mock_client):
+            assert svc.probe_folders("my-bucket", "p/", ["p/a/"]) == {"p/a/": True}
+            assert svc.probe_folders("my-bucket", "p/", ["p/a/"]) == {"p/a/": True}
+            assert svc.is_folder_empty("my-bucket", "p/a/") is True
+        assert mock_client.list_objects_v2.call_count == 1
+
+    def test_change_to_bucket_drops_cached_answers(self):
+        mock_client = MagicMock()
+        svc = self._service(mock_client)
+        with patch("boto3.client", return_value=mock_client):
+            svc.probe_folders("my-bucket", "p/", ["p/a/"])
+            svc.upload_fileobj(MagicMock(), "my-bucket", "p/a/new")
+            svc.probe_folders("my-bucket", "p/", ["p/a/"])
+        assert mock_client.list_objects_v2.call_count == 2
+
+    def test_entries_expire_and_are_bounded(self):
+        mock_client = MagicMock()
+        svc = self._service(mock_client)
+        with patch("boto3.client", return_value=mock_client), \
+                patch("finch.s3.service.EMPTINESS_CACHE_SIZE", 2):
+            with patch("time.monotonic", return_value=1000.0):
+                svc.probe_folders("my-bucket", "p/", ["p/a/", "p/b/", "p/c/"])
+            assert len(svc._emptiness) == 2
+            with patch("time.monotonic", return_value=1000.0 + 3600):
+                svc.probe_folders("my-bucket", "p/", ["p/b/"])
+        assert mock_client.list_objects_v2.call_count == 2
+
+
+class TestS3ServiceCoalesce:
+    def test_concurrent_callers_share_one_call(self):
+        svc = make_service()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(svc._coalesce, "k", slow)]
+            while not calls:
+                time.sleep(0.001)
+            # The first call is now in flight; these must join it.
+            futures += [pool.submit(svc._coalesce, "k", slow) for _ in range(3)]
+            time.sleep(0.02)
+            release.set()
+            results = [f.result() for f in futures]
+        assert results == [42] * 4
+        assert calls == [1] and svc._inflight == {}
+
+    def test_errors_reach_every_waiter_and_clear(self):
+        svc = make_service()
+        with pytest.raises(RuntimeError):
+            svc._coalesce("k", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+        assert svc._inflight == {}
+        assert svc._coalesce("k", lambda: 1) == 1
+
+
+class TestS3ServiceDeleteObjects:
+    def test_single_request_for_small_batch(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {}
+        with patch("boto3.client", return_value=mock_client):
+            svc.delete_objects("my-bucket", ["a.txt", "b.txt"])
+        mock_client.delete_objects.assert_called_once_with(
+            Bucket="my-bucket",
+            Delete={"Objects": [{"Key": "a.txt"}, {"Key": "b.txt"}], "Quiet": True},
+        )
+
+    def test_chunks_at_1000_keys(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {}
+        keys = [f"k{i}" for i in range(2500)]
+        with patch("boto3.client", return_value=mock_client):
+            svc.delete_objects("my-bucket", keys)
+        sizes = [len(c.kwargs["Delete"]["Objects"]) for c in mock_client.delete_objects.call_args_list]
+        assert sorted(sizes, reverse=True) == [1000, 1000, 500]
+
+    def test_batches_after_the_first_run_concurrently(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def delete_objects(**kwargs):
+            if mock_client.delete_objects.call_count > 1:
+                barrier.wait()   # breaks (and raises) unless both batches are in flight
+            return {}
+
+        mock_client.delete_objects.side_effect = delete_objects
+        keys = [f"k{i}" for i in range(3000)]
+        with patch("boto3.client", return_value=mock_client):
+            svc.delete_objects("my-bucket", keys)
+        assert mock_client.delete_objects.call_count == 3
+
+    def test_delete_bucket_batches_versions(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {}
+        mock_client.get_bucket_versioning.return_value = {"Status": "Enabled"}
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {"Versions": [{"Key": "a", "VersionId": "1"}],
+             "DeleteMarkers": [{"Key": "a", "VersionId": "2"}]},
+        ]
+        with patch("boto3.client", return_value=mock_client):
+            svc.delete_bucket("my-bucket")
+        mock_client.delete_objects.assert_called_once_with(
+            Bucket="my-bucket",
+            Delete={"Objects": [{"Key": "a", "VersionId": "1"}, {"Key": "a", "VersionId": "2"}],
+                    "Quiet": True},
+        )
+        mock_client.delete_bucket.assert_called_once_with(Bucket="my-bucket")
+
+    def test_errors_raise(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {
+            "Errors": [{"Key": "a.txt", "Code": "AccessDenied", "Message": "denied"}]
+        }
+        with patch("boto3.client", return_value=mock_client):
+            with pytest.raises(RuntimeError, match="a.txt"):
+                svc.delete_objects("my-bucket", ["a.txt"])
+
+    def test_delete_folder_merges_small_pages(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {}
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "f/a"}, {"Key": "f/b"}]},
+            {"Contents": [{"Key": "f/c"}]},
+        ]
+        with patch("boto3.client", return_value=mock_client):
+            svc.delete_folder("my-bucket", "f/")
+        mock_client.delete_objects.assert_called_once_with(
+            Bucket="my-bucket",
+            Delete={"Objects": [{"Key": "f/a"}, {"Key": "f/b"}, {"Key": "f/c"}], "Quiet": True},
+        )
+        mock_client.delete_object.assert_not_called()
+
+    def test_accepts_any_iterable_of_keys(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {}
+        with patch("boto3.client", return_value=mock_client):
+            svc.delete_objects("my-bucket", (f"k{i}" for i in range(1001)))
+        sizes = sorted(len(c.kwargs["Delete"]["Objects"]) for c in mock_client.delete_objects.call_args_list)
+        assert sizes == [1, 1000]
+
+    def test_falls_back_to_single_deletes_when_unsupported(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.delete_objects.side_effect = ClientError(
+            {"Error": {"Code": "NotImplemented", "Message": "nope"}}, "DeleteObjects"
+        )
+        with patch("boto3.client", return_value=mock_client):
+            svc.delete_objects("my-bucket", ["a.txt", "b.txt"])
+            svc.delete_objects("my-bucket", ["c.txt"])
+        mock_client.delete_objects.assert_called_once()
+        deleted = sorted(c.kwargs["Key"] for c in mock_client.delete_object.call_args_list)
+        assert deleted == ["a.txt", "b.txt", "c.txt"]
+
+    def test_other_client_errors_propagate(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.delete_objects.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "DeleteObjects"
+        )
+        with patch("boto3.client", return_value=mock_client):
+            with pytest.raises(ClientError):
+                svc.delete_objects("my-bucket", ["a.txt"])
+        mock_client.delete_object.assert_not_called()
+
+    def test_single_deletes_reuse_the_service_pool(self):
+        svc = make_service()
+        svc._batch_delete_supported = False
+        mock_client = MagicMock()
+        mock_client.delete_object.side_effect = [None, RuntimeError("gone")]
+        with patch("boto3.client", return_value=mock_client), \
+                patch("finch.s3.service.ThreadPoolExecutor") as mock_pool:
+            with pytest.raises(RuntimeError):
+                svc.delete_objects("my-bucket", ["a.txt", "b.txt"])
+        mock_pool.assert_not_called()
+
+
+class TestS3ServiceWalkObjects:
+    def test_walks_nested_prefixes(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        tree = {
+            "": {"Contents": [{"Key": "root.txt"}], "CommonPrefixes": [{"Prefix": "a/"}, {"Prefix": "b/"}]},
+            "a/": {"Contents": [{"Key": "a/"}, {"Key": "a/1.txt"}], "CommonPrefixes": [{"Prefix": "a/deep/"}]},
+            "a/deep/": {"Contents": [{"Key": "a/deep/2.txt"}]},
+            "b/": {"Contents": [{"Key": "b/3.txt"}]},
+        }
+        mock_client.list_objects_v2.side_effect = lambda Bucket, Prefix, Delimiter: tree[Prefix]
+        with patch("boto3.client", return_value=mock_client):
+            keys = sorted(o["Key"] for o in svc.walk_objects("my-bucket"))
+        assert keys == ["a/", "a/1.txt", "a/deep/2.txt", "b/3.txt", "root.txt"]
+
+    def test_follows_continuation_tokens(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        pages = {
+            None: {"Contents": [{"Key": "1"}], "IsTruncated": True, "NextContinuationToken": "t1"},
+            "t1": {"Contents": [{"Key": "2"}], "CommonPrefixes": [{"Prefix": "d/"}]},
+        }
+
+        def list_objects_v2(Bucket, Prefix, Delimiter, ContinuationToken=None):
+            if Prefix == "d/":
+                return {"Contents": [{"Key": "d/3"}]}
+            return pages[ContinuationToken]
+
+        mock_client.list_objects_v2.side_effect = list_objects_v2
+        with patch("boto3.client", return_value=mock_client):
+            keys = sorted(o["Key"] for o in svc.walk_objects("my-bucket"))
+        assert keys == ["1", "2", "d/3"]
+        assert mock_client.list_objects_v2.call_count == 3
+
+    def test_wide_shallow_tree_is_listed_flat(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        folders = [f"d{i:04}/" for i in range(1000)]
+        # "d0500.txt" sits among the sub-folders but lives directly under the root.
+        flat = sorted([f"{d}k" for d in folders] + ["d0500.txt", "root.txt"])
+
+        def list_objects_v2(Bucket, Prefix, Delimiter=None, MaxKeys=None, StartAfter=None,
+                            ContinuationToken=None):
+            if Delimiter:
+                return {"Contents": [{"Key": "d0500.txt"}, {"Key": "root.txt"}],
+                        "CommonPrefixes": [{"Prefix": d} for d in folders]}
+            return {"Contents": [{"Key": k} for k in flat if k > StartAfter]}
+
+        mock_client.list_objects_v2.side_effect = list_objects_v2
+        with patch("boto3.client", return_value=mock_client):
+            keys = sorted(o["Key"] for o in svc.walk_objects("my-bucket"))
+        assert keys == flat
+        assert mock_client.list_objects_v2.call_count == 2
+
+    def test_walk_starts_at_prefix(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {"Contents": [{"Key": "p/x"}]}
+        with patch("boto3.client", return_value=mock_client):
+            assert [o["Key"] for o in svc.walk_objects("my-bucket", "p/")] == ["p/x"]
+        mock_client.list_objects_v2.assert_called_once_with(
+            Bucket="my-bucket", Prefix="p/", Delimiter="/"
+        )
+
+
+class TestS3ServiceInventory:
+    def _service(self, mock_client):
+        svc = make_service()
+        mock_client.list_objects_v2.return_value = {
+            "Contents": [{"Key": "b/2"}, {"Key": "a/1"}, {"Key": "b/1"}]
+        }
+        return svc
+
+    def test_sorted_and_reused(self):
+        mock_client = MagicMock()
+        svc = self._service(mock_client)
+        with patch("boto3.client", return_value=mock_client):
+            first = svc.list_inventory("my-bucket")
+            second = svc.list_inventory("my-bucket")
+        assert [o["Key"] for o in first] == ["a/1", "b/1", "b/2"]
+        assert second == first
+        assert mock_client.list_objects_v2.call_count == 1
+
+    def test_narrower_prefix_served_from_cache(self):
+        mock_client = MagicMock()
+        svc = self._service(mock_client)
+        with patch("boto3.client", return_value=mock_client):
+            svc.list_inventory("my-bucket")
+            narrowed = svc.list_inventory("my-bucket", "b/")
+        assert [o["Key"] for o in narrowed] == ["b/1", "b/2"]
+        assert mock_client.list_objects_v2.call_count == 1
+
+    def test_mutation_invalidates(self):
+        mock_client = MagicMock()
+        svc = self._service(mock_client)
+        with patch("boto3.client", return_value=mock_client):
+            svc.list_inventory("my-bucket")
+            svc.delete_object("my-bucket", "a/1")
+            svc.list_inventory("my-bucket")
+        assert mock_client.list_objects_v2.call_count == 2
+
+    def test_expires_after_ttl(self):
+        mock_client = MagicMock()
+        svc = self._service(mock_client)
+        with patch("boto3.client", return_value=mock_client):
+            with patch("time.monotonic", return_value=1000.0):
+                svc.list_inventory("my-bucket")
+            with patch("time.monotonic", return_value=1000.0 + 3600):
+                svc.list_inventory("my-bucket")
+        assert mock_client.list_objects_v2.call_count == 2
+
+
+class TestS3ServiceIterObjects:
+    def test_yields_one_batch_per_page(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {"CommonPrefixes": [{"Prefix": "p/sub/"}], "Contents": [{"Key": "p/", "Size": 0, "LastModified": None}]},
+            {"Contents": [{"Key": "p/a.txt", "Size": 3, "LastModified": None}]},
+        ]
+        with patch("boto3.client", return_value=mock_client):
+            pages = list(svc.iter_objects("my-bucket", "p/"))
+        assert [[o.key for o in page] for page in pages] == [["p/sub/"], ["p/a.txt"]]
+        mock_client.get_paginator.assert_called_once_with("list_objects_v2")
+        mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="my-bucket", Prefix="p/", Delimiter="/", PaginationConfig={"PageSize": 1000}
+        )
+
+    def test_start_after_skips_ahead(self):
+        svc = make_service()
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.return_value = []
+        with patch("boto3.client", return_value=mock_client):
+            list(svc.iter_objects("my-bucket", "p/", start_after="p/k"))
+        mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="my-bucket", Prefix="p/", Delimiter="/", StartAfter="p/k",
+            PaginationConfig={"PageSize": 1000},
+        )
@@ -1,6 +1,7 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
+from botocore.utils import parse_timestamp
 
 from finch.utils.text import (
     format_datetime,
@@ -17,6 +18,10 @@ class TestKeyDisplayName:
     def test_folder_key_trailing_slash(self):
         assert key_display_name("folder/subfolder/") == "subfolder"
 
+    def test_repeated_slashes(self):
+        assert key_display_name("a//b//") == "b"
+        assert key_display_name("//") == ""
+
     def test_root_key(self):
         assert key_display_name("file.txt") == "file.txt"
 
@@ -51,6 +56,12 @@ class TestFormatSize:
         result = format_size(1024)
         assert "1 Kilobytes" in result
 
+    def test_unit_boundaries(self):
+        assert format_size(1023).endswith(" Bytes")
+        assert format_size(1023.9).endswith(" Bytes")
+        assert format_size(1024).endswith(" Kilobytes")
+        assert format_size(5 * 1024 ** 4).strip() == "5120 Gigabytes"
+
     def test_decimal_places(self):
         result = format_size(1536, decimal_places=1)
         assert "1.5 Kilobytes" in result
@@ -82,6 +93,27 @@ class TestFormatDatetime:
         dt = datetime(2024, 1, 15, 10, 30)
         assert format_datetime(dt) == "2024-01-15"
 
+    def test_minutes_share_one_strftime(self, mocker):
+        mocker.patch("finch.utils.text.app_settings.datetime_format", "%H:%M")
+        first = format_datetime(datetime(2024, 1, 15, 10, 30, 5))
+        second = format_datetime(datetime(2024, 1, 15, 10, 30, 59))
+        assert first == second == "10:30"
+
+    def test_seconds_format_not_truncated(self, mocker):
+        mocker.patch("finch.utils.text.app_settings.datetime_format", "%H:%M:%S")
+        assert format_datetime(datetime(2024, 1, 15, 10, 30, 59)) == "10:30:59"
+
+    def test_keeps_timezone(self, mocker):
+        mocker.patch("finch.utils.text.app_settings.datetime_format", "%H:%M %Z")
+        dt = datetime(2024, 1, 15, 10, 30, 5, tzinfo=timezone.utc)
+        assert format_datetime(dt) == "10:30 UTC"
+
+    def test_botocore_timestamp(self, mocker):
+        # S3 LastModified values carry unhashable dateutil tzinfo objects.
+        mocker.patch("finch.utils.text.app_settings.datetime_format", "%Y-%m-%d %H:%M %z")
+        dt = parse_timestamp("2024-01-01T03:04:05.000Z")
+        assert format_datetime(dt) == dt.strftime("%Y-%m-%d %H:%M %z")
+
     def test_default_format(self):
         dt = datetime(2024, 1, 15, 10, 30)
         result = format_datetime(dt)
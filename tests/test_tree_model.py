@@ -0,0 +1,590 @@
+import asyncio
+import threading
+import time
+from dataclasses import fields
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QPersistentModelIndex, Qt
+
+from finch.browser.model import BACKGROUND_REQUESTS, S3FileTreeModel, S3Node
+from finch.config import ObjectType
+from finch.s3.service import S3Object
+
+
+def make_object(name, obj_type=ObjectType.FILE, bucket="bkt"):
+    return S3Object(
+        name=name, type=obj_type, size=0, last_modified=datetime(2024, 1, 1),
+        bucket_name=bucket, key=name,
+    )
+
+
+@pytest.fixture
+def model(qt_app):
+    return S3FileTreeModel()
+
+
+def attach(parent, obj):
+    node = S3Node(s3_object=obj, parent=parent)
+    parent.children.append(node)
+    parent.child_index[(obj.key, obj.type)] = node
+    return node
+
+
+def add_bucket(model, name="bkt", children=()):
+    bucket = attach(model._root, make_object(name, ObjectType.BUCKET, name))
+    for child in children:
+        attach(bucket, make_object(child))
+    bucket.is_loaded = True
+    return bucket
+
+
+class TestRemoveNodes:
+    def test_removes_contiguous_rows_in_one_signal(self, model):
+        bucket = add_bucket(model, children=["a", "b", "c", "d"])
+        removed = []
+        model.rowsAboutToBeRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+        model.remove_nodes(bucket.children[1:3])
+        assert [c.s3_object.name for c in bucket.children] == ["a", "d"]
+        assert removed == [(1, 2)]
+
+    def test_removes_separate_runs_bottom_up(self, model):
+        bucket = add_bucket(model, children=["a", "b", "c", "d", "e"])
+        removed = []
+        model.rowsAboutToBeRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+        model.remove_nodes([bucket.children[0], bucket.children[3], bucket.children[4]])
+        assert [c.s3_object.name for c in bucket.children] == ["b", "c"]
+        assert removed == [(3, 4), (0, 0)]
+
+    def test_groups_by_parent(self, model):
+        first = add_bucket(model, "one", children=["a", "b"])
+        second = add_bucket(model, "two", children=["c"])
+        model.remove_nodes([first.children[1], second.children[0]])
+        assert [c.s3_object.name for c in first.children] == ["a"]
+        assert second.children == []
+
+
+class TestBusy:
+    def test_emits_loading_signals_once(self, model):
+        events = []
+        model.loading_started.connect(lambda: events.append("start"))
+        model.loading_finished.connect(lambda: events.append("finish"))
+        with model.busy():
+            with model.busy():
+                pass
+        assert events == ["start", "finish"]
+
+    def test_finishes_on_error(self, model):
+        events = []
+        model.loading_finished.connect(lambda: events.append("finish"))
+        with pytest.raises(RuntimeError):
+            with model.busy():
+                raise RuntimeError("boom")
+        assert events == ["finish"]
+
+
+class TestObjectsLoaded:
+    def test_skips_duplicates_and_existing_children(self, model):
+        bucket = add_bucket(model, children=["a"])
+        bucket.is_loaded = False
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        model._on_objects_loaded(bucket, [make_object("a"), make_object("b"), make_object("b")])
+        assert [c.s3_object.name for c in bucket.children] == ["a", "b"]
+        assert inserted == [(1, 1)]
+        assert bucket.is_loaded
+
+
+class TestSort:
+    def test_sorts_by_name_with_folders_first(self, model):
+        bucket = add_bucket(model, children=["b.txt", "A.txt"])
+        attach(bucket, make_object("zdir/", ObjectType.FOLDER))
+        model.sort(0, Qt.AscendingOrder)
+        assert [c.s3_object.name for c in bucket.children] == ["zdir/", "A.txt", "b.txt"]
+        model.sort(0, Qt.DescendingOrder)
+        assert [c.s3_object.name for c in bucket.children] == ["zdir/", "b.txt", "A.txt"]
+
+    def test_sort_keeps_persistent_indexes(self, model):
+        bucket = add_bucket(model, children=["b", "a"])
+        bucket_index = model.index(0, 0)
+        pidx = QPersistentModelIndex(model.index(0, 0, bucket_index))
+        assert pidx.internalPointer().s3_object.name == "b"
+        model.sort(0, Qt.AscendingOrder)
+        assert pidx.row() == 1
+        assert pidx.internalPointer().s3_object.name == "b"
+
+    def test_loaded_children_follow_current_sort(self, model):
+        bucket = add_bucket(model)
+        bucket.is_loaded = False
+        model.sort(2, Qt.DescendingOrder)
+        small, big = make_object("small"), make_object("big")
+        small.size, big.size = 1, 100
+        model._on_objects_loaded(bucket, [small, big])
+        assert [c.s3_object.name for c in bucket.children] == ["big", "small"]
+
+    def test_sort_reaches_below_single_child_levels(self, model):
+        bucket = add_bucket(model)
+        folder = attach(bucket, make_object("dir/", ObjectType.FOLDER))
+        attach(folder, make_object("dir/b"))
+        attach(folder, make_object("dir/a"))
+        model.sort(0, Qt.AscendingOrder)
+        assert [c.s3_object.name for c in folder.children] == ["dir/a", "dir/b"]
+
+    @pytest.mark.parametrize("order, expected", [
+        (Qt.AscendingOrder, ["dir/", "a", "b", "c"]),
+        (Qt.DescendingOrder, ["dir/", "c", "b", "a"]),
+    ])
+    def test_insert_child_lands_in_sorted_row(self, model, order, expected):
+        bucket = add_bucket(model, children=["a", "c"])
+        attach(bucket, make_object("dir/", ObjectType.FOLDER))
+        model.sort(0, order)
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append(first))
+        model.insert_child(bucket, make_object("b"))
+        assert [c.s3_object.name for c in bucket.children] == expected
+        assert inserted == [2]
+
+
+class TestDetach:
+    def test_removed_subtree_is_unlinked(self, model):
+        bucket = add_bucket(model, children=["a"])
+        child = bucket.children[0]
+        model.remove_node(bucket)
+        assert bucket.parent is None and bucket.children == []
+        assert child.parent is None
+
+    def test_late_listing_for_removed_node_is_ignored(self, model):
+        bucket = add_bucket(model, children=["a"])
+        folder = attach(bucket, make_object("dir/", ObjectType.FOLDER))
+        folder.is_loading = True
+        model.remove_nodes([folder])
+        model._on_objects_loaded(folder, [make_object("dir/x")])
+        assert folder.children == []
+        assert not folder.is_loading
+        assert model.rowCount(model.index(0, 0)) == 1
+
+    def test_cancel_detaches_tree_and_silences_loading(self, model):
+        bucket = add_bucket(model, children=["a"])
+        stopped = []
+        model.loading_finished.connect(lambda: stopped.append(True))
+        model._inc_load()
+        model.cancel()
+        assert bucket.parent is None and model.rowCount() == 0
+        model._on_buckets_loaded([make_object("late", ObjectType.BUCKET)])
+        assert model.rowCount() == 0
+        assert stopped == []
+
+
+    def test_cancel_cancels_pending_listings(self, model):
+        bucket = add_bucket(model)
+        bucket.is_loaded = False
+        release = threading.Event()
+
+        def pages():
+            release.wait(5)
+            yield [make_object("late")]
+
+        async def run():
+            with patch("finch.browser.model.s3_service.iter_objects", return_value=pages()):
+                model.fetchMore(model.index(0, 0))
+                task, = model._tasks
+                await asyncio.sleep(0.01)
+                model.cancel()
+                release.set()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+            assert model._tasks == set()
+
+        asyncio.run(run())
+        assert bucket.children == []
+
+
+class TestFetchPages:
+    def test_inserts_each_page_and_resorts(self, model):
+        bucket = add_bucket(model)
+        bucket.is_loaded = False
+        bucket.is_loading = True
+        pages = [[make_object("c"), make_object("a")], [make_object("b")]]
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        with patch("finch.browser.model.s3_service.iter_objects", return_value=iter(pages)):
+            asyncio.run(model._fetch_async(bucket))
+        assert inserted == [(0, 1), (2, 2)]
+        assert [c.s3_object.name for c in bucket.children] == ["a", "b", "c"]
+        assert bucket.is_loaded and not bucket.is_loading
+
+    def test_listing_error_keeps_earlier_pages(self, model):
+
+        def pages():
+            yield [make_object("a")]
+            raise RuntimeError("connection reset")
+
+        bucket = add_bucket(model)
+        bucket.is_loaded = False
+        bucket.is_loading = True
+        with patch("finch.browser.model.s3_service.iter_objects", return_value=pages()):
+            asyncio.run(model._fetch_async(bucket))
+        assert [c.s3_object.name for c in bucket.children] == ["a"]
+        assert bucket.is_loaded and not bucket.is_loading
+
+    def test_detached_node_stops_consuming_pages(self, model):
+        bucket = add_bucket(model)
+        bucket.is_loading = True
+        served = []
+        model.rowsInserted.connect(lambda *args: model.remove_node(bucket))
+
+        def pages():
+            for name in ("a", "b", "c", "d"):
+                served.append(name)
+                yield [make_object(name)]
+
+        with patch("finch.browser.model.s3_service.iter_objects", return_value=pages()):
+            asyncio.run(model._fetch_async(bucket))
+        assert bucket.children == []
+        assert len(served) < 4
+
+
+class TestCompaction:
+    def test_single_child_folder_chain_collapses(self, model):
+        bucket = add_bucket(model)
+        folder = attach(bucket, make_object("a/", ObjectType.FOLDER))
+        folder.s3_object.name = "a"
+        listings = {
+            "a/": [[S3Object(key="a/b/", name="b", type=ObjectType.FOLDER, bucket_name="bkt")]],
+            "a/b/": [[S3Object(key="a/b/c/", name="c", type=ObjectType.FOLDER, bucket_name="bkt")]],
+            "a/b/c/": [[make_object("a/b/c/x"), make_object("a/b/c/y")]],
+        }
+        folder.is_loading = True
+        with patch("finch.browser.model.app_settings.compact_single_child_chains", True), \
+                patch("finch.browser.model.s3_service.iter_objects",
+                      side_effect=lambda bucket, prefix: iter(listings[prefix])):
+            asyncio.run(model._fetch_async(folder))
+        assert folder.s3_object.key == "a/b/c/" and folder.s3_object.name == "a/b/c"
+        assert [c.s3_object.key for c in folder.children] == ["a/b/c/x", "a/b/c/y"]
+        assert folder.is_loaded
+        assert model.find_node("bkt", "a/b/c/") is folder
+        assert model.find_node("bkt", "a/b/c/x") is folder.children[0]
+
+    def test_compacted_folder_moves_to_sorted_row(self, model):
+        bucket = add_bucket(model)
+        for key in ("a/", "a.b/", "b/"):
+            attach(bucket, make_object(key, ObjectType.FOLDER)).s3_object.name = key[:-1]
+        folder = bucket.children[0]
+        moves = []
+        model.rowsMoved.connect(lambda parent, first, last, dest, row: moves.append((first, row)))
+        folder.is_loading = True
+        listings = {
+            "a/": [[S3Object(key="a/x/", name="x", type=ObjectType.FOLDER, bucket_name="bkt")]],
+            "a/x/": [[make_object("a/x/f")]],
+        }
+        with patch("finch.browser.model.app_settings.compact_single_child_chains", True), \
+                patch("finch.browser.model.s3_service.iter_objects",
+                      side_effect=lambda bucket, prefix: iter(listings[prefix])):
+            asyncio.run(model._fetch_async(folder))
+        assert [c.s3_object.name for c in bucket.children] == ["a.b", "a/x", "b"]
+        assert folder.row == 1 and moves == [(0, 2)]
+
+    def test_folder_prefix_covers_collapsed_folders(self, model):
+        bucket = add_bucket(model)
+        folder = attach(bucket, make_object("a/", ObjectType.FOLDER))
+        assert folder.folder_prefix == "a/"
+        listings = {
+            "a/": [[S3Object(key="a/b/", name="b", type=ObjectType.FOLDER, bucket_name="bkt")]],
+            "a/b/": [[S3Object(key="a/b/c/", name="c", type=ObjectType.FOLDER, bucket_name="bkt")]],
+            "a/b/c/": [[make_object("a/b/c/x")]],
+        }
+        folder.is_loading = True
+        with patch("finch.browser.model.app_settings.compact_single_child_chains", True), \
+                patch("finch.browser.model.s3_service.iter_objects",
+                      side_effect=lambda bucket, prefix: iter(listings[prefix])):
+            asyncio.run(model._fetch_async(folder))
+        # Deleting the row must remove the a/ and a/b/ markers too, not just a/b/c/.
+        assert folder.s3_object.key == "a/b/c/"
+        assert folder.folder_prefix == "a/"
+
+    def test_disabled_by_default(self, model):
+        bucket = add_bucket(model)
+        folder = attach(bucket, make_object("a/", ObjectType.FOLDER))
+        folder.is_loading = True
+        page = [[S3Object(key="a/b/", name="b", type=ObjectType.FOLDER, bucket_name="bkt")]]
+        with patch("finch.browser.model.s3_service.iter_objects", return_value=iter(page)):
+            asyncio.run(model._fetch_async(folder))
+        assert folder.s3_object.key == "a/"
+        assert [c.s3_object.key for c in folder.children] == ["a/b/"]
+
+
+class TestLookahead:
+    def test_expanding_adopts_lookahead_listing(self, model):
+        bucket = add_bucket(model)
+        bucket.is_loaded = False
+        bucket.is_loading = True
+        listings = {
+            "": [[make_object("a/", ObjectType.FOLDER), make_object("f")]],
+            "a/": [[make_object("a/x")], [make_object("a/y")]],
+        }
+        calls = []
+
+        def iter_objects(bucket_name, prefix):
+            calls.append(prefix)
+            return iter(listings[prefix])
+
+        async def run():
+            await model._fetch_async(bucket)
+            folder = bucket.children[0]
+            assert folder.lookahead is not None
+            await asyncio.sleep(0.05)
+            folder.is_loading = True
+            await model._fetch_async(folder)
+            return folder
+
+        with patch("finch.browser.model.s3_service.iter_objects", side_effect=iter_objects):
+            folder = asyncio.run(run())
+        assert calls == ["", "a/"]
+        assert [c.s3_object.name for c in folder.children] == ["a/x", "a/y"]
+        assert folder.lookahead is None
+
+    def test_stale_lookahead_is_relisted(self, model):
+        bucket = add_bucket(model)
+        folder = attach(bucket, make_object("a/", ObjectType.FOLDER))
+        calls = []
+
+        def iter_objects(bucket_name, prefix):
+            calls.append(prefix)
+            return iter([[make_object("a/x")]])
+
+        async def run():
+            model._start_lookahead(bucket)
+            await folder.lookahead
+            folder.is_loading = True
+            with patch("finch.browser.model.time.monotonic", return_value=time.monotonic() + 3600):
+                await model._fetch_async(folder)
+
+        with patch("finch.browser.model.s3_service.iter_objects", side_effect=iter_objects):
+            asyncio.run(run())
+        assert calls == ["a/", "a/"]
+        assert [c.s3_object.name for c in folder.children] == ["a/x"]
+
+    def test_expansion_does_not_wait_for_queued_lookahead(self, model):
+        bucket = add_bucket(model)
+        folder = attach(bucket, make_object("a/", ObjectType.FOLDER))
+        calls = []
+
+        def iter_objects(bucket_name, prefix):
+            calls.append(prefix)
+            return iter([[make_object("a/x")]])
+
+        async def run():
+            # Probes hold every background slot, so the look-ahead stays queued.
+            for _ in range(BACKGROUND_REQUESTS):
+                await model._background.acquire()
+            model._start_lookahead(bucket)
+            lookahead = folder.lookahead
+            await asyncio.sleep(0)
+            folder.is_loading = True
+            await asyncio.wait_for(model._fetch_async(folder), timeout=1)
+            await asyncio.sleep(0)
+            return lookahead
+
+        with patch("finch.browser.model.s3_service.iter_objects", side_effect=iter_objects):
+            lookahead = asyncio.run(run())
+        assert lookahead.cancelled()
+        assert [c.s3_object.name for c in folder.children] == ["a/x"]
+        assert folder.is_loaded
+
+
+class TestData:
+    def test_formatted_cells_are_cached(self, model):
+        add_bucket(model, children=["a"])
+        index = model.index(0, 2, model.index(0, 0))
+        with patch("finch.browser.model.format_size", return_value="0 Bytes") as mock_fmt:
+            assert index.data() == "0 Bytes"
+            assert index.data() == "0 Bytes"
+        mock_fmt.assert_called_once()
+
+    def test_type_cell_is_plain_str(self, model):
+        add_bucket(model, children=["a"])
+        value = model.index(0, 1, model.index(0, 0)).data()
+        assert value == "File" and type(value) is str
+
+
+class TestHasChildren:
+    def test_answers_by_node_state(self, model):
+        bucket = add_bucket(model, children=["f"])
+        folder = attach(bucket, make_object("dir/", ObjectType.FOLDER))
+        bucket_index = model.index(0, 0)
+        file_index = model.index(0, 0, bucket_index)
+        folder_index = model.index(1, 0, bucket_index)
+        assert model.hasChildren(bucket_index)
+        assert not model.hasChildren(file_index)
+        assert not model.canFetchMore(file_index)
+        assert model.hasChildren(folder_index) and model.canFetchMore(folder_index)
+        folder.is_loaded = True
+        assert not model.hasChildren(folder_index)
+        assert not model.canFetchMore(folder_index)
+
+
+class TestEmptyCheck:
+    def test_skips_probe_for_folder_already_loading(self, model):
+        folder = S3Node(s3_object=make_object("dir/", ObjectType.FOLDER), parent=add_bucket(model))
+        folder.is_loading = True
+        with patch("finch.browser.model.s3_service.is_folder_empty") as mock_probe:
+            assert model._probe_empty(folder) is False
+        mock_probe.assert_not_called()
+
+    def test_new_folders_are_settled_by_one_bulk_probe(self, model):
+        bucket = add_bucket(model)
+        bucket.is_loaded = False
+        folders = [make_object(k, ObjectType.FOLDER) for k in ("a/", "b/", "c/")]
+
+        async def load():
+            model._on_objects_loaded(bucket, folders)
+            await asyncio.sleep(0.05)
+
+        with patch("finch.browser.model.app_settings.check_folder_contents", True), \
+                patch("finch.browser.model.s3_service.probe_folders",
+                      return_value={"a/": True, "b/": False}) as mock_bulk, \
+                patch("finch.browser.model.s3_service.is_folder_empty",
+                      return_value=True) as mock_single:
+            asyncio.run(load())
+        mock_bulk.assert_called_once_with("bkt", "", ["a/", "b/", "c/"])
+        mock_single.assert_called_once_with("bkt", "c/")
+        assert [c.is_loaded for c in bucket.children] == [True, False, True]
+
+    def test_bulk_results_emit_one_data_changed(self, model):
+        bucket = add_bucket(model)
+        folders = [attach(bucket, make_object(k, ObjectType.FOLDER)) for k in ("a/", "b/", "c/")]
+        changes, layouts = [], []
+        model.dataChanged.connect(lambda first, last: changes.append((first.row(), last.row())))
+        model.layoutChanged.connect(lambda: layouts.append(True))
+        with patch("finch.browser.model.s3_service.probe_folders",
+                   return_value={"a/": True, "b/": True, "c/": True}):
+            asyncio.run(model._empty_check_batch_async(bucket, folders))
+        assert changes == [(0, 2)]
+        assert layouts == []
+
+    def test_background_probes_are_bounded(self, model):
+        bucket = add_bucket(model)
+        folders = [attach(bucket, make_object(f"d{i}/", ObjectType.FOLDER))
+                   for i in range(BACKGROUND_REQUESTS * 2)]
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def probe(bucket_name, key):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return False
+
+        async def run():
+            await asyncio.gather(*(model._empty_check_async(f) for f in folders))
+
+        with patch("finch.browser.model.s3_service.is_folder_empty", side_effect=probe):
+            asyncio.run(run())
+        assert peak[0] <= BACKGROUND_REQUESTS
+
+    def test_user_listing_bypasses_background_cap(self, model):
+        bucket = add_bucket(model)
+        folder = attach(bucket, make_object("a/", ObjectType.FOLDER))
+
+        async def run():
+            for _ in range(BACKGROUND_REQUESTS):
+                await model._background.acquire()
+            folder.is_loading = True
+            await asyncio.wait_for(model._fetch_async(folder), timeout=1)
+
+        with patch("finch.browser.model.s3_service.iter_objects",
+                   return_value=iter([[make_object("a/x")]])):
+            asyncio.run(run())
+        assert folder.is_loaded
+
+    def test_empty_result_does_not_clobber_loading_folder(self, model):
+        folder = S3Node(s3_object=make_object("dir/", ObjectType.FOLDER), parent=add_bucket(model))
+        folder.is_loading = True
+        model._on_empty_check_done(folder, True)
+        assert not folder.is_loaded
+
+
+class TestRow:
+    def test_row_tracks_sort_and_removal(self, model):
+        bucket = add_bucket(model, children=["c", "b", "a"])
+        c, b, a = bucket.children
+        assert (c.row, b.row, a.row) == (0, 1, 2)
+        model.sort(0, Qt.AscendingOrder)
+        assert (a.row, b.row, c.row) == (0, 1, 2)
+        model.remove_node(a)
+        assert (b.row, c.row) == (0, 1)
+
+
+class TestForObject:
+    def test_matches_generated_init(self):
+        parent = S3Node(s3_object=None)
+        obj = make_object("Dir/", ObjectType.FOLDER)
+        fast, slow = S3Node.for_object(obj, parent), S3Node(s3_object=obj, parent=parent)
+        for f in fields(S3Node):
+            assert getattr(fast, f.name) == getattr(slow, f.name), f.name
+
+
+class TestChildIndex:
+    def test_find_node_descends_by_key(self, model):
+        bucket = add_bucket(model)
+        folder = attach(bucket, make_object("a/", ObjectType.FOLDER))
+        sub = attach(folder, make_object("a/b/", ObjectType.FOLDER))
+        leaf = attach(sub, make_object("a/b/c.txt"))
+        assert model.find_node("bkt") is bucket
+        assert model.find_node("bkt", "a/") is folder
+        assert model.find_node("bkt", "a/b/") is sub
+        assert model.find_node("bkt", "a/b/c.txt") is leaf
+        assert model.find_node("bkt", "a/x/") is None
+        assert model.find_node("missing") is None
+
+    def test_insert_children_adds_batch_in_one_insertion(self, model):
+        bucket = add_bucket(model, children=["b"])
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        model.insert_children(bucket, [make_object("c"), make_object("b"), make_object("a")])
+        assert inserted == [(1, 2)]
+        assert [c.s3_object.name for c in bucket.children] == ["a", "b", "c"]
+        assert model.find_node("bkt", "a") is bucket.children[0]
+
+    def test_insert_child_returns_existing_duplicate(self, model):
+        bucket = add_bucket(model, children=["a"])
+        assert model.insert_child(bucket, make_object("a")) is bucket.children[0]
+        assert len(bucket.children) == 1
+
+    def test_reinserted_key_shows_new_object(self, model):
+        bucket = add_bucket(model, children=["a"])
+        size_index = model.index(0, 2, model.index(0, 0))
+        assert size_index.data().strip() == "0 Bytes"
+        changed = []
+        model.dataChanged.connect(lambda first, last: changed.append((first.column(), last.column())))
+        newer = S3Object(name="a", type=ObjectType.FILE, size=2048,
+                         last_modified=datetime(2024, 6, 1), bucket_name="bkt", key="a")
+        assert model.insert_child(bucket, newer) is bucket.children[0]
+        assert bucket.children[0].s3_object is newer
+        assert size_index.data().strip() == "2 Kilobytes"
+        assert changed == [(0, 3)]
+
+    def test_insert_children_refreshes_existing_rows(self, model):
+        bucket = add_bucket(model, children=["a"])
+        newer = S3Object(name="a", type=ObjectType.FILE, size=5, bucket_name="bkt", key="a")
+        model.insert_children(bucket, [newer, make_object("b")])
+        assert bucket.children[0].s3_object is newer
+        assert len(bucket.children) == 2
+
+    def test_removal_unindexes(self, model):
+        bucket = add_bucket(model, children=["a", "b"])
+        model.remove_nodes([bucket.children[0]])
+        model.remove_node(bucket.children[0])
+        assert bucket.child_index == {}
+        assert model.find_node("bkt", "a") is None
+
+
+class TestIcons:
+    def test_icons_shared_between_models(self, qt_app):
+        first, second = S3FileTreeModel(), S3FileTreeModel()
+        obj = make_object("dir/", ObjectType.FOLDER)
+        assert first._get_icon(obj) is second._get_icon(obj)